@@ -0,0 +1,493 @@
+"""Benchmarks for the validation and serialization hot paths.
+
+Usage: `python benchmarks/run.py [-k PATTERN] [-o OUTPUT] [--compare BASELINE]`
+
+Each benchmark reports the best time per call (in seconds) over a number of repeats.
+Results are written as JSON, and can be compared against a saved baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+import time
+import timeit
+import warnings
+from pathlib import Path
+from typing import Any, Callable, List
+
+import pint
+import pydantic
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel, Field
+
+import pydantic_pint
+from pydantic_pint import PydanticPintQuantity, get_registry, pydantic_pint_value
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+BENCHMARKS: dict[str, Callable[[], Callable[[], Any]]] = {}
+"""Benchmark name -> setup function returning the function to time."""
+
+LIST_SIZE = 10_000
+
+
+def benchmark(name: str):
+    def decorator(setup: Callable[[], Callable[[], Any]]):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+def _model(annotation: PydanticPintQuantity, source_type: Any = PlainQuantity):
+    class Model(BaseModel):
+        value: Annotated[source_type, annotation]
+
+    return Model
+
+
+# =============================================================================
+#  validation
+# =============================================================================
+
+
+def _validate(annotation: PydanticPintQuantity, value: Any):
+    model = _model(annotation)
+    return lambda: model(value=value)
+
+
+def _validate_json(annotation: PydanticPintQuantity, value: Any):
+    model = _model(annotation)
+    data = json.dumps({"value": value})
+    return lambda: model.model_validate_json(data)
+
+
+@benchmark("validate/str/units")
+def _():
+    return _validate(PydanticPintQuantity("m"), "1.5 km")
+
+
+@benchmark("validate/str/units-same")
+def _():
+    return _validate(PydanticPintQuantity("m"), "1.5 m")
+
+
+@benchmark("validate/str/expression")
+def _():
+    return _validate(PydanticPintQuantity("m/s"), "3 m / (2 s)")
+
+
+@benchmark("validate/str/dimensions")
+def _():
+    return _validate(PydanticPintQuantity("[length]"), "1.5 km")
+
+
+@benchmark("validate/str/exact")
+def _():
+    return _validate(PydanticPintQuantity("m", exact=True), "1.5 m")
+
+
+@benchmark("validate/str/offset")
+def _():
+    return _validate(PydanticPintQuantity("degC"), "98.6 degF")
+
+
+@benchmark("validate/str/contexts")
+def _():
+    return _validate(PydanticPintQuantity("nm", ureg_contexts=["sp"]), "500 THz")
+
+
+@benchmark("validate/str/allowed-units")
+def _():
+    return _validate(PydanticPintQuantity("m", allowed_units=["m", "km"]), "1.5 km")
+
+
+@benchmark("validate/dict/units")
+def _():
+    return _validate(PydanticPintQuantity("m"), {"magnitude": 1.5, "units": "km"})
+
+
+@benchmark("validate/dict/dimensions")
+def _():
+    return _validate(
+        PydanticPintQuantity("[length]"), {"magnitude": 1.5, "units": "km"}
+    )
+
+
+@benchmark("validate/number/non-strict")
+def _():
+    return _validate(PydanticPintQuantity("m", strict=False), 1.5)
+
+
+@benchmark("validate/quantity/units")
+def _():
+    return _validate(PydanticPintQuantity("m"), get_registry().Quantity(1.5, "km"))
+
+
+@benchmark("validate/quantity/units-same")
+def _():
+    return _validate(PydanticPintQuantity("m"), get_registry().Quantity(1.5, "m"))
+
+
+@benchmark("validate/quantity/dimensions")
+def _():
+    return _validate(
+        PydanticPintQuantity("[length]"), get_registry().Quantity(1.5, "km")
+    )
+
+
+@benchmark("validate-json/str/units")
+def _():
+    return _validate_json(PydanticPintQuantity("m"), "1.5 km")
+
+
+@benchmark("validate-json/dict/units")
+def _():
+    return _validate_json(PydanticPintQuantity("m"), {"magnitude": 1.5, "units": "km"})
+
+
+@benchmark("validate-json/number/non-strict")
+def _():
+    return _validate_json(PydanticPintQuantity("m", strict=False), 1.5)
+
+
+def _validate_error(annotation: PydanticPintQuantity, value: Any):
+    model = _model(annotation)
+
+    def validate():
+        try:
+            model(value=value)
+        except pydantic.ValidationError:
+            pass
+
+    return validate
+
+
+@benchmark("validate-error/str/unknown-unit")
+def _():
+    return _validate_error(PydanticPintQuantity("m"), "1.5 meterz")
+
+
+@benchmark("validate-error/str/dimensionality")
+def _():
+    return _validate_error(PydanticPintQuantity("m"), "1.5 s")
+
+
+# =============================================================================
+#  lists
+# =============================================================================
+
+
+@benchmark("validate-list/str/units")
+def _():
+    model = _model(PydanticPintQuantity("m"), List[PlainQuantity])
+    values = [f"{i * 0.5} km" for i in range(LIST_SIZE)]
+    return lambda: model(value=values)
+
+
+@benchmark("validate-list/json/str/units")
+def _():
+    model = _model(PydanticPintQuantity("m"), List[PlainQuantity])
+    data = json.dumps({"value": [f"{i * 0.5} km" for i in range(LIST_SIZE)]})
+    return lambda: model.model_validate_json(data)
+
+
+@benchmark("validate-list/json/columnar")
+def _():
+    model = _model(
+        PydanticPintQuantity("m", ser_mode="columnar"), List[PlainQuantity]
+    )
+    data = json.dumps(
+        {"value": {"units": "km", "magnitudes": [i * 0.5 for i in range(LIST_SIZE)]}}
+    )
+    return lambda: model.model_validate_json(data)
+
+
+# =============================================================================
+#  serialization
+# =============================================================================
+
+
+def _serialize(ser_mode: str | None, mode: str, source_type: Any = PlainQuantity):
+    ureg = get_registry()
+    model = _model(PydanticPintQuantity("m", ser_mode=ser_mode), source_type)
+    if source_type is PlainQuantity:
+        instance = model(value=ureg.Quantity(1.5, "m"))
+    else:
+        instance = model(value=[ureg.Quantity(i * 0.5, "m") for i in range(LIST_SIZE)])
+    return lambda: instance.model_dump(mode=mode)
+
+
+@benchmark("serialize/default/python")
+def _():
+    return _serialize(None, "python")
+
+
+@benchmark("serialize/default/json")
+def _():
+    return _serialize(None, "json")
+
+
+@benchmark("serialize/str/json")
+def _():
+    return _serialize("str", "json")
+
+
+@benchmark("serialize/dict/json")
+def _():
+    return _serialize("dict", "json")
+
+
+@benchmark("serialize/number/json")
+def _():
+    return _serialize("number", "json")
+
+
+@benchmark("serialize-list/str/json")
+def _():
+    return _serialize("str", "json", List[PlainQuantity])
+
+
+@benchmark("serialize-list/dict/json")
+def _():
+    return _serialize("dict", "json", List[PlainQuantity])
+
+
+@benchmark("serialize-list/columnar/json")
+def _():
+    return _serialize("columnar", "json", List[PlainQuantity])
+
+
+# =============================================================================
+#  values
+# =============================================================================
+
+
+@benchmark("value/construct")
+def _():
+    return lambda: pydantic_pint_value(1.5, "m")
+
+
+@benchmark("value/field-validate")
+def _():
+    class Model(BaseModel):
+        value: Annotated[
+            PlainQuantity,
+            PydanticPintQuantity("m"),
+            Field(gt=pydantic_pint_value(1, "m")),
+        ]
+
+    return lambda: Model(value="1.5 km")
+
+
+@benchmark("value/serialize")
+def _():
+    class Model(BaseModel):
+        model_config = {"arbitrary_types_allowed": True}
+        value: PlainQuantity
+
+    instance = Model(value=pydantic_pint_value(1.5, "m"))
+    return lambda: instance.model_dump(mode="json")
+
+
+# =============================================================================
+#  schema
+# =============================================================================
+
+
+@benchmark("schema/build")
+def _():
+    def build():
+        # annotations are interned; build a new one every time
+        PydanticPintQuantity._interned.clear()
+
+        class Model(BaseModel):
+            value: Annotated[PlainQuantity, PydanticPintQuantity("m")]
+
+        return Model
+
+    return build
+
+
+@benchmark("schema/build-interned")
+def _():
+    def build():
+        class Model(BaseModel):
+            value: Annotated[PlainQuantity, PydanticPintQuantity("m")]
+
+        return Model
+
+    return build
+
+
+# =============================================================================
+#  runner
+# =============================================================================
+
+
+def run(
+    names: list[str],
+    *,
+    min_time: float = 0.2,
+    repeat: int = 5,
+) -> dict[str, float]:
+    results = {}
+    for name in names:
+        func = BENCHMARKS[name]()
+        func()  # warm up caches and lazy loading
+
+        # number of calls per repeat, so each repeat takes at least `min_time`
+        timer = timeit.Timer(func)
+        number, _ = timer.autorange()
+        number = max(1, int(number * min_time / 0.2))
+
+        best = min(timer.repeat(repeat=repeat, number=number)) / number
+        results[name] = best
+        print(f"{name:<40} {_format_time(best):>12}", flush=True)
+
+    return results
+
+
+def compare(
+    results: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+) -> list[str]:
+    print()
+    print(f"{'benchmark':<40} {'baseline':>12} {'current':>12} {'ratio':>8}")
+
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            print(f"{name:<40} {'-':>12} {_format_time(current):>12} {'-':>8}")
+            continue
+
+        ratio = current / previous
+        flag = ""
+        if ratio > threshold:
+            flag = "  (slower)"
+            regressions.append(name)
+        print(
+            f"{name:<40} {_format_time(previous):>12} {_format_time(current):>12}"
+            f" {ratio:>7.2f}x{flag}"
+        )
+
+    return regressions
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
+
+
+def _metadata() -> dict[str, Any]:
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "pydantic-pint": pydantic_pint.__version__,
+        "pydantic": pydantic.VERSION,
+        "pint": pint.__version__,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-k",
+        dest="patterns",
+        action="append",
+        default=[],
+        help="only run benchmarks matching the glob pattern (repeatable)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="write the results to a JSON file",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="compare the results to a baseline JSON file",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="ratio to the baseline reported as a regression (default: 1.2)",
+    )
+    parser.add_argument(
+        "--fail",
+        action="store_true",
+        help="exit with an error if there are regressions",
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        default=0.2,
+        help="minimum time per repeat in seconds (default: 0.2)",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="number of repeats; the best is reported (default: 5)",
+    )
+    parser.add_argument(
+        "--list",
+        action="store_true",
+        help="list the benchmarks and exit",
+    )
+    args = parser.parse_args(argv)
+
+    # python serialization returns quantities where pydantic expects strings
+    warnings.filterwarnings("ignore", message="Pydantic serializer warnings")
+
+    names = [
+        name
+        for name in BENCHMARKS
+        if not args.patterns or any(fnmatch.fnmatch(name, p) for p in args.patterns)
+    ]
+
+    if args.list:
+        print("\n".join(names))
+        return 0
+
+    results = run(names, min_time=args.min_time, repeat=args.repeat)
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        report: dict[str, Any] = {"metadata": _metadata(), "results": results}
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"\nresults written to '{args.output}'")
+
+    if args.compare:
+        if not args.compare.exists():
+            print(f"\nno baseline found at '{args.compare}'")
+            return 0
+
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) slower than {args.threshold}x")
+            if args.fail:
+                return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,9 @@ DIST = Path("dist")
 DOCS = Path("docs")
 SITE = Path("site")
 REPORTS = Path("reports")
+BENCHMARKS = Path("benchmarks")
+BENCHMARKS_BASELINE = Path(".benchmarks") / "baseline.json"
+PINT_MIN_VERSION = "0.20"
 
 
 def _get_package():
@@ -232,6 +235,76 @@ def test(session: nox.Session):
     session.run(*pytest_command(), *remaining, success_codes=(0, 5))
 
 
+@nox.session(name="test-pint-min")
+def test_pint_min(session: nox.Session):
+    """Run tests against the minimum supported version of Pint"""
+
+    def pytest_command():
+        return [
+            "pytest",
+            "tests",
+        ]  # fmt: skip
+
+    session.install("-e", ".[tests]")
+    # pint 0.20 does not support numpy 2
+    session.install(f"pint=={PINT_MIN_VERSION}", "numpy<2")
+    session.log(f"# Running tests with pint {PINT_MIN_VERSION}")
+    session.run(*pytest_command(), *session.posargs, success_codes=(0, 5))
+
+
+@nox.session(name="benchmark")
+def benchmark(session: nox.Session):
+    """Run benchmarks"""
+    args, remaining = _parse_args(
+        session,
+        session.posargs,
+        "nox -s benchmark",
+        dict(
+            args=["-o", "--output"],
+            type=Path,
+            default=REPORTS,
+            help="output directory for generated reports",
+        ),
+        dict(
+            args=["-b", "--baseline"],
+            type=Path,
+            default=BENCHMARKS_BASELINE,
+            help="baseline results to compare against",
+        ),
+        dict(
+            args=["--save"],
+            action=argparse.BooleanOptionalAction,
+            default=False,
+            help="save the results as the new baseline",
+        ),
+        command="`python benchmarks/run.py`",
+    )
+
+    output: Path = args.output
+    baseline: Path = args.baseline
+    save: bool = args.save
+
+    output.mkdir(exist_ok=True)
+    results = output / "benchmarks.json"
+
+    def benchmark_command():
+        return [
+            "python",
+            f"{BENCHMARKS / 'run.py'}",
+            "--output", f"{results}",
+            *_add_args_if(not save, "--compare", f"{baseline}"),
+        ]  # fmt: skip
+
+    session.install("-e", ".[tests]")
+    session.log(f"# Running benchmarks")
+    session.run(*benchmark_command(), *remaining)
+
+    if save:
+        baseline.parent.mkdir(parents=True, exist_ok=True)
+        baseline.write_text(results.read_text())
+        session.log(f"# Saved baseline: {baseline}")
+
+
 @nox.session(name="build")
 def build(session: nox.Session):
     """Build Package"""
@@ -0,0 +1,230 @@
+"""Defines the caches used to speed up `PydanticPintQuantity` validation."""
+
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import NamedTuple
+
+import pint
+
+__all__ = [
+    "DEFAULT_UNIT_CACHE_SIZE",
+    "DEFAULT_UNKNOWN_UNIT_CACHE_SIZE",
+    "DEFAULT_UNKNOWN_UNIT_TTL",
+    "UnitCache",
+    "UnitCacheInfo",
+    "clear_unit_caches",
+    "get_unit_cache",
+]
+
+
+DEFAULT_UNIT_CACHE_SIZE = 512
+"""Default maximum number of unit strings stored per unit registry."""
+
+DEFAULT_UNKNOWN_UNIT_CACHE_SIZE = 256
+"""Default maximum number of unknown unit strings remembered per unit registry."""
+
+DEFAULT_UNKNOWN_UNIT_TTL = 60.0
+"""Default time in seconds unknown unit strings are remembered."""
+
+
+class UnitCacheInfo(NamedTuple):
+    """Statistics of a `UnitCache`."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    unknown_hits: int = 0
+    unknown_currsize: int = 0
+
+
+class UnitCache:
+    """Bounded least recently used cache of parsed unit strings.
+
+    Maps the units part of a quantity string (e.g. `"kPa"` in `"12.5 kPa"`)
+    to the resolved `pint.Unit` of a single unit registry.
+
+    Unit strings that are not defined in the unit registry are remembered for `unknown_ttl` seconds,
+    and rejected without parsing them again. Clear the cache after defining new units in the registry
+    for them to be accepted right away.
+
+    Args:
+        registry:
+            The unit registry used to parse unit strings.
+        maxsize:
+            The maximum number of unit strings stored in the cache.
+        unknown_maxsize:
+            The maximum number of unknown unit strings remembered by the cache.
+        unknown_ttl:
+            The time in seconds unknown unit strings are remembered.
+    """
+
+    def __init__(
+        self,
+        registry: pint.UnitRegistry,
+        maxsize: int = DEFAULT_UNIT_CACHE_SIZE,
+        unknown_maxsize: int = DEFAULT_UNKNOWN_UNIT_CACHE_SIZE,
+        unknown_ttl: float = DEFAULT_UNKNOWN_UNIT_TTL,
+    ):
+        self.maxsize = maxsize
+        self.unknown_maxsize = unknown_maxsize
+        self.unknown_ttl = unknown_ttl
+        self.hits = 0
+        self.misses = 0
+        self.unknown_hits = 0
+        # incremented when the cache is cleared; units parsed before are not stored
+        self.generation = 0
+
+        self._registry = weakref.ref(registry)
+        self._units: OrderedDict[str, pint.Unit] = OrderedDict()
+        # unknown unit string -> (expiry time, undefined unit names)
+        self._unknown: OrderedDict[str, tuple[float, tuple[str, ...]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, units: str) -> pint.Unit:
+        """Get the parsed units, parsing and storing them on a cache miss.
+
+        Args:
+            units: The units string.
+
+        Returns:
+            The resolved `pint.Unit`.
+
+        Raises:
+            pint.PintError: The units string is not defined in the unit registry.
+            ValueError: The units string is not a plain unit expression.
+        """
+        try:
+            unit = self._units[units]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            try:
+                self._units.move_to_end(units)
+            except KeyError:
+                # evicted by another thread in the meantime
+                pass
+            return unit
+
+        if self._unknown:
+            self._check_unknown(units)
+
+        self.misses += 1
+
+        registry = self._registry()
+        if registry is None:
+            raise TypeError("unit registry of unit cache no longer exists")
+
+        # the cache may be cleared while parsing, e.g. after defining new units
+        generation = self.generation
+        try:
+            unit = registry.Unit(units)
+        except pint.UndefinedUnitError as e:
+            self._add_unknown(units, e.unit_names, generation)
+            raise
+
+        with self._lock:
+            if generation != self.generation:
+                return unit
+            self._units[units] = unit
+            while len(self._units) > self.maxsize:
+                self._units.popitem(last=False)
+
+        return unit
+
+    def _check_unknown(self, units: str):
+        # raises for unknown unit strings that have not expired yet
+        try:
+            expiry, names = self._unknown[units]
+        except KeyError:
+            return
+
+        if time.monotonic() < expiry:
+            self.unknown_hits += 1
+            raise pint.UndefinedUnitError(names)
+
+        with self._lock:
+            self._unknown.pop(units, None)
+
+    def _add_unknown(self, units: str, names: str | tuple[str, ...], generation: int):
+        if self.unknown_maxsize <= 0:
+            return
+
+        expiry = time.monotonic() + self.unknown_ttl
+        names = (names,) if isinstance(names, str) else tuple(names)
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._unknown[units] = (expiry, names)
+            self._unknown.move_to_end(units)
+            while len(self._unknown) > self.unknown_maxsize:
+                self._unknown.popitem(last=False)
+
+    def info(self) -> UnitCacheInfo:
+        """Get the cache statistics.
+
+        Returns:
+            The hits, misses, maximum size and current size of the cache,
+            and the hits and current size of the unknown unit strings.
+        """
+        return UnitCacheInfo(
+            self.hits,
+            self.misses,
+            self.maxsize,
+            len(self._units),
+            self.unknown_hits,
+            len(self._unknown),
+        )
+
+    def clear(self):
+        """Clear the cache, including the unknown unit strings, and reset the statistics."""
+        with self._lock:
+            self._units.clear()
+            self._unknown.clear()
+            self.hits = 0
+            self.misses = 0
+            self.unknown_hits = 0
+            self.generation += 1
+
+
+# the unit cache is stored on its registry; a cache of the registry units would keep the registry
+# alive in a global mapping
+_UNIT_CACHE_ATTR = "_pydantic_pint_unit_cache"
+_UNIT_CACHES: weakref.WeakSet[UnitCache] = weakref.WeakSet()
+# guards adding unit caches, so they can be cleared while other threads validate
+_UNIT_CACHES_LOCK = threading.Lock()
+
+
+def get_unit_cache(registry: pint.UnitRegistry) -> UnitCache:
+    """Get the unit cache of a unit registry.
+
+    Args:
+        registry: The unit registry.
+
+    Returns:
+        The unit cache belonging to the unit registry.
+    """
+    cache = getattr(registry, _UNIT_CACHE_ATTR, None)
+    if cache is not None:
+        return cache
+
+    with _UNIT_CACHES_LOCK:
+        cache = getattr(registry, _UNIT_CACHE_ATTR, None)
+        if cache is None:
+            cache = UnitCache(registry)
+            setattr(registry, _UNIT_CACHE_ATTR, cache)
+            _UNIT_CACHES.add(cache)
+        return cache
+
+
+def clear_unit_caches():
+    """Clear the unit caches of all unit registries."""
+    with _UNIT_CACHES_LOCK:
+        caches = list(_UNIT_CACHES)
+    for cache in caches:
+        cache.clear()
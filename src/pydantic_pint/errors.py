@@ -0,0 +1,91 @@
+"""Defines the error types of `PydanticPintQuantity` validation failures."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pint
+from pydantic_core import InitErrorDetails, PydanticCustomError, ValidationError
+
+__all__ = [
+    "ERROR_TYPES",
+    "QUANTITY_ARRAY",
+    "QUANTITY_DIMENSIONALITY",
+    "QUANTITY_EXACT",
+    "QUANTITY_MISSING_KEYS",
+    "QUANTITY_NOT_ALLOWED",
+    "QUANTITY_PARSING",
+    "QUANTITY_STRICT",
+    "QUANTITY_UNKNOWN_UNIT",
+]
+
+
+QUANTITY_MISSING_KEYS = "quantity_missing_keys"
+"""A `dict` value is missing its magnitude or units."""
+QUANTITY_STRICT = "quantity_strict"
+"""A value has no units, but units are required."""
+QUANTITY_EXACT = "quantity_exact"
+"""The units or dimensions of a value do not match exactly."""
+QUANTITY_DIMENSIONALITY = "quantity_dimensionality"
+"""The units of a value cannot be converted to the units or dimensions of the field."""
+QUANTITY_UNKNOWN_UNIT = "quantity_unknown_unit"
+"""The units of a value are not defined in the unit registry."""
+QUANTITY_NOT_ALLOWED = "quantity_not_allowed"
+"""The units of a value are not one of the allowed units."""
+QUANTITY_PARSING = "quantity_parsing"
+"""A value cannot be parsed by the unit registry."""
+QUANTITY_ARRAY = "quantity_array"
+"""An array magnitude has the wrong data type or shape."""
+
+ERROR_TYPES = (
+    QUANTITY_MISSING_KEYS,
+    QUANTITY_STRICT,
+    QUANTITY_EXACT,
+    QUANTITY_DIMENSIONALITY,
+    QUANTITY_UNKNOWN_UNIT,
+    QUANTITY_NOT_ALLOWED,
+    QUANTITY_PARSING,
+    QUANTITY_ARRAY,
+)
+"""The error types of `pydantic_core.PydanticCustomError`s raised in validation."""
+
+
+# the context holds the raw values (e.g. units), the message is only rendered when
+# the error is displayed; rejected values are not formatted on the failure path
+
+
+def _pint_error(error: pint.PintError) -> PydanticCustomError:
+    # typed error from an error of the unit registry
+    if isinstance(error, pint.UndefinedUnitError):
+        names = error.unit_names
+        return PydanticCustomError(
+            QUANTITY_UNKNOWN_UNIT,
+            "'{units}' is not defined in the unit registry",
+            {"units": names if isinstance(names, str) else ", ".join(names)},
+        )
+
+    if isinstance(error, pint.DimensionalityError):
+        return PydanticCustomError(
+            QUANTITY_DIMENSIONALITY,
+            "cannot convert from '{from_units}' ({from_dimensions}) "
+            "to '{to_units}' ({to_dimensions})",
+            {
+                "from_units": error.units1,
+                "from_dimensions": error.dim1,
+                "to_units": error.units2,
+                "to_dimensions": error.dim2,
+            },
+        )
+
+    return PydanticCustomError(QUANTITY_PARSING, "{error}", {"error": error})
+
+
+def _item_error(index: int, error: ValueError, value: Any) -> ValidationError:
+    # error of a value in a list, located at the index of the value, e.g. `("x", 1)` in a model
+    if isinstance(error, PydanticCustomError):
+        details = InitErrorDetails(type=error, loc=(index,), input=value)
+    else:
+        details = InitErrorDetails(
+            type="value_error", loc=(index,), input=value, ctx={"error": error}
+        )
+    return ValidationError.from_exception_data("PydanticPintQuantity", [details])
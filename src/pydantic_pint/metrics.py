@@ -0,0 +1,161 @@
+"""Defines the opt-in metrics of `PydanticPintQuantity` annotations."""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any, NamedTuple
+
+import pint
+from pydantic_core import PydanticCustomError
+
+from pydantic_pint.errors import (
+    QUANTITY_DIMENSIONALITY,
+    QUANTITY_EXACT,
+    QUANTITY_NOT_ALLOWED,
+    QUANTITY_STRICT,
+    QUANTITY_UNKNOWN_UNIT,
+)
+
+__all__ = [
+    "FAILURE_REASONS",
+    "QuantityMetrics",
+    "QuantityMetricsSnapshot",
+    "collect_metrics",
+    "reset_metrics",
+]
+
+
+FAILURE_REASONS = ("strict", "exact", "dimensionality", "unknown_unit", "other")
+"""Reasons validation failures are counted by."""
+
+# error type of validation errors -> failure reason
+_FAILURE_TYPES = {
+    QUANTITY_STRICT: "strict",
+    QUANTITY_EXACT: "exact",
+    QUANTITY_DIMENSIONALITY: "dimensionality",
+    QUANTITY_UNKNOWN_UNIT: "unknown_unit",
+    QUANTITY_NOT_ALLOWED: "unknown_unit",
+}
+
+
+class QuantityMetricsSnapshot(NamedTuple):
+    """Metrics of a `PydanticPintQuantity` annotation at a point in time."""
+
+    name: str | None
+    """The name of the metrics, if any."""
+    target: str
+    """The units or dimensions of the annotation."""
+    validations: int
+    """The number of validated values."""
+    validation_time: float
+    """The cumulative time spent validating, in seconds."""
+    serializations: int
+    """The number of serialized values."""
+    serialization_time: float
+    """The cumulative time spent serializing, in seconds."""
+    conversions: int
+    """The number of unit conversions, including failed ones."""
+    conversion_cache_hits: int
+    """The number of conversions with a memoized conversion factor."""
+    failures: dict[str, int]
+    """The number of validation failures by reason, see `FAILURE_REASONS`."""
+
+
+class QuantityMetrics:
+    """Counters and timers of a `PydanticPintQuantity` annotation.
+
+    Created by the annotation when it is constructed with the `metrics` option.
+
+    Args:
+        name: The name of the metrics, e.g. the name of the field.
+        target: The units or dimensions of the annotation.
+    """
+
+    def __init__(self, name: str | None, target: str):
+        self.name = name
+        self.target = target
+        self.reset()
+        _METRICS.add(self)
+
+    def reset(self):
+        """Reset the counters and timers."""
+        self.validations = 0
+        self.validation_time = 0.0
+        self.serializations = 0
+        self.serialization_time = 0.0
+        self.conversions = 0
+        self.conversion_cache_hits = 0
+        self.failures = dict.fromkeys(FAILURE_REASONS, 0)
+
+    def record_failure(self, error: BaseException):
+        """Count a validation failure by its reason.
+
+        Args:
+            error: The validation error.
+        """
+        self.failures[_failure_reason(error)] += 1
+
+    def snapshot(self) -> QuantityMetricsSnapshot:
+        """Get the current metrics.
+
+        Returns:
+            A snapshot of the counters and timers.
+        """
+        return QuantityMetricsSnapshot(
+            name=self.name,
+            target=self.target,
+            validations=self.validations,
+            validation_time=self.validation_time,
+            serializations=self.serializations,
+            serialization_time=self.serialization_time,
+            conversions=self.conversions,
+            conversion_cache_hits=self.conversion_cache_hits,
+            failures=dict(self.failures),
+        )
+
+
+class _CountingDict(dict):
+    # memo of conversion factors counting the conversions (lookups) and cache hits
+
+    def __init__(self, metrics: QuantityMetrics, *args: Any):
+        super().__init__(*args)
+        self.metrics = metrics
+
+    def __getitem__(self, key: Any) -> Any:
+        self.metrics.conversions += 1
+        value = super().__getitem__(key)
+        self.metrics.conversion_cache_hits += 1
+        return value
+
+
+def _failure_reason(error: BaseException) -> str:
+    # classified by the error type, without rendering the error message
+    # errors of a value in a list are caused by the error of the value
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(cause, PydanticCustomError):
+            return _FAILURE_TYPES.get(cause.type, "other")
+        if isinstance(cause, pint.DimensionalityError):
+            return "dimensionality"
+        if isinstance(cause, pint.UndefinedUnitError):
+            return "unknown_unit"
+        cause = cause.__cause__
+    return "other"
+
+
+_METRICS: weakref.WeakSet[QuantityMetrics] = weakref.WeakSet()
+
+
+def collect_metrics() -> list[QuantityMetricsSnapshot]:
+    """Get the metrics of all annotations collecting metrics.
+
+    Returns:
+        A snapshot of the metrics of each annotation.
+    """
+    return [metrics.snapshot() for metrics in list(_METRICS)]
+
+
+def reset_metrics():
+    """Reset the metrics of all annotations collecting metrics."""
+    for metrics in list(_METRICS):
+        metrics.reset()
@@ -0,0 +1,108 @@
+"""Defines helpers to validate many quantities off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Iterable, Sequence
+
+from pint.facets.plain import PlainQuantity as Quantity
+
+from pydantic_pint.errors import _item_error
+from pydantic_pint.quantity import PydanticPintQuantity
+
+__all__ = [
+    "DEFAULT_CHUNK_SIZE",
+    "validate_quantities_async",
+]
+
+
+DEFAULT_CHUNK_SIZE = 1000
+"""Default number of values validated per task."""
+
+
+async def validate_quantities_async(
+    annotation: PydanticPintQuantity,
+    values: Iterable[Any],
+    *,
+    executor: Executor | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> list[Quantity]:
+    """Validate many values with `PydanticPintQuantity.validate` without blocking the event loop.
+
+    The values are split into chunks, and each chunk is validated in the executor.
+
+    With a `concurrent.futures.ProcessPoolExecutor`, the annotation and the validated quantities
+    are pickled with the name of their unit registry (see `pydantic_pint.registry.register_registry`),
+    and reattached to the registry of the same name in the worker processes and back.
+    If a custom global or named unit registry is used, set it in the workers as well
+    (e.g. with the `initializer` of the executor).
+
+    The registry of `pydantic_pint.registry.use_registry` is resolved before the values are sent
+    to the executor, whose threads and processes do not share the context of the caller.
+
+    Args:
+        annotation:
+            The annotation used to validate the values.
+        values:
+            The values that should be validated.
+        executor:
+            The thread or process pool running the validation.
+            If not specified, the default executor of the event loop is used.
+        chunk_size:
+            The number of values validated per task.
+
+    Returns:
+        The validated `pint.Quantity` values with the correct units, in order.
+
+    Raises:
+        ValueError:
+            An error occurred validating one of the values.
+            It is raised as a `pydantic_core.ValidationError` located at the index of the value.
+            See `PydanticPintQuantity.validate` for more details.
+        TypeError:
+            The annotation cannot be pickled for a worker process,
+            because it uses an unnamed unit registry or unit registry context objects.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk size must be positive")
+
+    # the annotation with the registry of `use_registry` in the caller's context
+    annotation = annotation._for_active_registry()
+
+    values = list(values)
+    chunks = [
+        (start, values[start:start + chunk_size])
+        for start in range(0, len(values), chunk_size)
+    ]
+
+    loop = asyncio.get_running_loop()
+    tasks = [
+        loop.run_in_executor(executor, _validate_chunk, annotation, start, chunk)
+        for start, chunk in chunks
+    ]
+    results = await asyncio.gather(*tasks)
+
+    validated = []
+    for chunk, failure in results:
+        if failure is not None:
+            # validation errors with custom error types cannot be unpickled from worker processes,
+            # so they are built here from the error of the value
+            i, e = failure
+            raise _item_error(i, e, values[i]) from e
+        validated.extend(chunk)
+    return validated
+
+
+def _validate_chunk(
+    annotation: PydanticPintQuantity,
+    start: int,
+    chunk: Sequence[Any],
+) -> tuple[list[Quantity], tuple[int, ValueError] | None]:
+    validated = []
+    for i, v in enumerate(chunk, start):
+        try:
+            validated.append(annotation.validate(v))
+        except ValueError as e:
+            return validated, (i, e)
+    return validated, None
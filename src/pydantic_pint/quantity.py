@@ -2,24 +2,171 @@
 
 from __future__ import annotations
 
+import re
+import time
+import weakref
+from decimal import Decimal
+from fractions import Fraction
 from numbers import Number
-from typing import TYPE_CHECKING, Any, Iterable, Literal, Mapping
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Literal,
+    Mapping,
+    Sequence,
+    get_origin,
+)
 
 if TYPE_CHECKING:
     from pydantic import GetCoreSchemaHandler
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 import pint
 from pint.facets.plain.quantity import PlainQuantity as Quantity
-from pint.facets.context.objects import Context
-from pydantic_core import core_schema
+from pint.facets.context.objects import Context, ContextChain
+from pint.facets.nonmultiplicative.definitions import LogarithmicConverter, OffsetConverter
+from pint.facets.plain.definitions import ScaleConverter
+from pint.util import UnitsContainer, find_shortest_path
+from pydantic_core import PydanticCustomError, core_schema
 
-from pydantic_pint.registry import get_registry
+from pydantic_pint.cache import get_unit_cache
+from pydantic_pint.errors import (
+    QUANTITY_ARRAY,
+    QUANTITY_DIMENSIONALITY,
+    QUANTITY_EXACT,
+    QUANTITY_MISSING_KEYS,
+    QUANTITY_NOT_ALLOWED,
+    QUANTITY_PARSING,
+    QUANTITY_STRICT,
+    _item_error,
+    _pint_error,
+)
+from pydantic_pint.metrics import QuantityMetrics, _CountingDict
+from pydantic_pint.registry import (
+    _ACTIVE_REGISTRY,
+    APP_REGISTRY_NAME,
+    _global_registry,
+    _register_reducers,
+    lookup_registry,
+    registry_name,
+)
 
 __all__ = [
     "PydanticPintQuantity",
 ]
 
 
+# matches "<number> <units>" strings, e.g. "12.5 kPa", "1m" or "-inf degC"
+# the units are empty for numbers
+# numbers that continue past the match (e.g. digit separators in "1_000 m") do not match,
+# so the units never start with a part of the number
+_QUANTITY_STRING = re.compile(
+    r"\s*([+-]?(?:(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|(?i:nan|inf(?:inity)?)\b))"
+    r"(?![\d._]|[eE][+-]?\d)"
+    r"\s*(.*?)\s*"
+)
+
+# maximum number of source units memoized per `PydanticPintQuantity`
+_MEMO_SIZE = 256
+
+# attribute of a unit registry with the annotations of the global registry cloned for it,
+# see `use_registry`: annotation -> the same annotation with the registry
+_REGISTRY_CLONES_ATTR = "_pydantic_pint_annotations"
+
+
+def _default_format(ureg: pint.UnitRegistry) -> str:
+    formatter = getattr(ureg, "formatter", None)
+    if formatter is not None:
+        return formatter.default_format
+    # pint < 0.24
+    return ureg.default_format
+
+# unit registry -> (argument, restriction) -> (restriction, units container, dimensions)
+# units are stored as their container, units of the registry would keep the registry alive
+_RESOLVED: weakref.WeakKeyDictionary[pint.UnitRegistry, dict[tuple, tuple]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _hashable(arg: Any) -> Any:
+    if isinstance(arg, Mapping):
+        return tuple(sorted(arg.items()))
+    if isinstance(arg, (list, tuple)):
+        return tuple(_hashable(a) for a in arg)
+    return arg
+
+
+def _unpickle_annotation(
+    name: str,
+    args: tuple,
+    kwargs: dict[str, Any],
+    contexts: list[str],
+) -> PydanticPintQuantity:
+    return PydanticPintQuantity(
+        *args,
+        # annotations of the global registry keep following the active registry
+        ureg=lookup_registry(name) if name != APP_REGISTRY_NAME else None,
+        ureg_contexts=contexts,
+        **kwargs,
+    )
+
+
+def _resolve(
+    ureg: pint.UnitRegistry,
+    arg: str | Mapping[str, int],
+    restriction: str | None,
+) -> tuple[str, pint.Unit | None, Any]:
+    key = (_hashable(arg), restriction)
+    resolved = _RESOLVED.setdefault(ureg, {})
+    try:
+        restriction, container, _dims = resolved[key]
+    except (KeyError, TypeError):
+        pass
+    else:
+        return restriction, (ureg.Unit(container) if container is not None else None), _dims
+
+    # if restriction is not specified, try to automatically figure out what to restrict
+    # this is based on how `pint` can digest the `_arg`
+    # e.g. `PydanticPintQuantity("meter")` -> automatically parse as units
+    # e.g. `PydanticPintQuantity("[length]")` -> automatically parse as dimensions
+
+    _units = None
+    _dims = None
+
+    if restriction is None or restriction == "units":
+        try:
+            _units = ureg(arg).units  # type: ignore
+            _dims = _units.dimensionality
+            restriction = "units"
+        except AttributeError:
+            if restriction == "units":
+                raise
+
+    if restriction is None or restriction == "dimensions":
+        try:
+            _units = None
+            _dims = ureg.get_dimensionality(arg)  # type: ignore
+            restriction = "dimensions"
+        except ValueError:
+            if restriction == "dimensions":
+                raise
+
+    if restriction is None:
+        raise ValueError(f"cannot deduce units or dimensions from '{arg}'")
+
+    try:
+        resolved[key] = (restriction, _units._units if _units is not None else None, _dims)
+    except TypeError:
+        # unhashable argument
+        pass
+    return restriction, _units, _dims
+
+
 class PydanticPintQuantity:
     """Pydantic Pint Quantity.
 
@@ -35,6 +182,8 @@ class PydanticPintQuantity:
             A custom Pint unit registry.
             If not specified, the default unit registry from `pydantic_pint.registry.app_registry` is used.
             See `pydantic_pint.registry.get_registry` and `pydantic_pint.registry.set_registry`.
+            If not specified, the annotation validates with the registry of `pydantic_pint.registry.use_registry`
+            in the current context, if any.
         ureg_contexts:
             A custom Pint context (or context name) for the default unit registry.
             All contexts are applied in validation conversion.
@@ -43,10 +192,14 @@ class PydanticPintQuantity:
             By default, it will automatically determine if the argument is specifying units or dimensions.
             It is recommended to use the default.
         ser_mode:
-            The mode for serializing the field; either `"str"`, `"dict", "number"`.
+            The mode for serializing the field; either `"str"`, `"dict", "number"`, `"columnar"`.
             By default, in Pydantic's `"python"` serialization mode, fields are serialzied to a `pint.Quantity`;
             in Pydantic's `"json"` serialziation mode, fields are serialized to a `str`.
             Note, the units are dropped when serializing to a number.
+            The `"columnar"` mode serializes a `list` of quantities (or an array magnitude) sharing the same units
+            to a single `{"units": ..., "magnitudes": [...]}` dict, and also accepts that form in validation.
+            It requires annotating the whole list, e.g. `Annotated[list[Quantity], PydanticPintQuantity(...)]`;
+            a quantity annotated on its own is serialized to a `dict`.
         strict:
             Forces users to specify units; on by default.
             If disabled, a value without units - provided by the user - will be treated as the base units of the `PydanticPintQuantity`.
@@ -56,8 +209,84 @@ class PydanticPintQuantity:
             If enabled, a value with units - provided by the user - must match the base units of the `PydanticPintQuantity`.
             Strict mode may be disabled as well, in which case, a value with no units will fall back to the base units.
             When restricting the dimensions, the user must match the base dimensions exactly, without using any custom transformations.
+        array:
+            Allows array magnitudes (a list or `numpy.ndarray`); off by default.
+            If enabled, the magnitude of the validated quantity is a `numpy.ndarray` and the whole array is converted at once.
+            Scalar magnitudes are rejected; in JSON, fields are serialized to a `dict` by default,
+            since the `str` form of an array magnitude cannot be validated.
+            Requires `numpy`.
+        dtype:
+            The data type of the array magnitude, e.g. `"float64"`; only used if `array` is enabled.
+            Magnitudes are cast to the data type if it can be done without losing its kind (e.g. integer to float).
+        shape:
+            The shape of the array magnitude; only used if `array` is enabled.
+            A dimension of `None` allows any length in that dimension.
+        allowed_units:
+            The accepted spellings of the units, e.g. `["m", "meter", "km"]`; any units by default.
+            Allowed units are resolved once, and the units of a value are looked up instead of parsed.
+            Values with other units (including quantities and unit expressions) are rejected.
+        float_format:
+            The format specification of float magnitudes when serializing to a `str`, e.g. `".6g"`.
+            By default, floats are serialized with their shortest round trip representation.
+        metrics:
+            Collects the metrics of the annotation in `metrics`; off by default.
+            A string names the metrics, e.g. after the field.
+            See `pydantic_pint.metrics`.
     """
 
+    # annotations with the same arguments are interned and share their resolved units,
+    # dimensions, conversions and core schemas
+    _interned: weakref.WeakValueDictionary[tuple, PydanticPintQuantity] = (
+        weakref.WeakValueDictionary()
+    )
+    _intern_key: tuple | None = None
+    _init_args: tuple[tuple, dict[str, Any]] = ((), {})
+    _follows_registry: bool = False
+    _initialized: bool = False
+
+    def __new__(
+        cls,
+        *args: Any,
+        ureg: pint.UnitRegistry | None = None,
+        ureg_contexts: Iterable[str | Context] | None = None,
+        **kwargs: Any,
+    ):
+        """Get the interned annotation with the same arguments, or create a new one."""
+        # the global registry is read once, it may be swapped by another thread;
+        # not the registry of `use_registry`, which is resolved on each use
+        registry = ureg if ureg else _global_registry()
+
+        key: tuple | None = None
+        # annotations collecting metrics are not interned, each collects its own metrics
+        if not kwargs.get("metrics") and (
+            ureg_contexts is None or isinstance(ureg_contexts, (list, tuple))
+        ):
+            key = (
+                cls,
+                _hashable(args),
+                # the key does not keep the registry alive, e.g. with annotations stored on the registry
+                weakref.ref(registry),
+                ureg is None,
+                _hashable(ureg_contexts or []),
+                _hashable(kwargs),
+            )
+            try:
+                return cls._interned[key]
+            except KeyError:
+                pass
+            except TypeError:
+                # unhashable arguments are not interned
+                key = None
+
+        inst = super().__new__(cls)
+        inst._intern_key = key
+        inst.ureg = registry
+        # annotations without a registry validate with the registry of `use_registry`
+        inst._follows_registry = ureg is None
+        # arguments without the unit registry and contexts, to rebuild the annotation elsewhere
+        inst._init_args = (args, kwargs)
+        return inst
+
     def __init__(
         self,
         _arg: str | Mapping[str, int],
@@ -66,49 +295,120 @@ class PydanticPintQuantity:
         ureg: pint.UnitRegistry | None = None,
         ureg_contexts: Iterable[str | Context] | None = None,
         restriction: Literal["units", "dimensions"] | None = None,
-        ser_mode: Literal["str", "dict", "number"] | None = None,
+        ser_mode: Literal["str", "dict", "number", "columnar"] | None = None,
         strict: bool = True,
         exact: bool = False,
+        array: bool = False,
+        dtype: str | None = None,
+        shape: Sequence[int | None] | None = None,
+        allowed_units: Iterable[str] | None = None,
+        float_format: str | None = None,
+        metrics: bool | str = False,
     ):
+        if self._initialized:
+            # interned annotation with the same arguments
+            return
+
         self.restriction = restriction.lower() if restriction else None
         self.ser_mode = ser_mode.lower() if ser_mode else None
+        self.float_format = float_format
         self.strict = strict
         self.exact = exact
 
-        self.ureg = ureg if ureg else get_registry()
-        self.ureg_contexts = ureg_contexts if ureg_contexts else []
+        if array and np is None:
+            raise ImportError("numpy is required for array quantities")
 
-        # if restriction is not specified, try to automatically figure out what to restrict
-        # this is based on how `pint` can digest the `_arg`
-        # e.g. `PydanticPintQuantity("meter")` -> automatically parse as units
-        # e.g. `PydanticPintQuantity("[length]")` -> automatically parse as dimensions
+        self.array = array
+        self.dtype = np.dtype(dtype) if array and dtype else None
+        self.shape = tuple(shape) if array and shape is not None else None
 
-        _units = None
-        _dims = None
+        # `self.ureg` is resolved in `__new__`, the same registry as the interning key
+        self.ureg_contexts = list(ureg_contexts) if ureg_contexts else []
 
-        if self.restriction is None or self.restriction == "units":
-            try:
-                _units = self.ureg(_arg).units  # type: ignore
-                _dims = _units.dimensionality
-                self.restriction = "units"
-            except AttributeError:
-                if self.restriction == "units":
-                    raise
-
-        if self.restriction is None or self.restriction == "dimensions":
-            try:
-                _units = None
-                _dims = self.ureg.get_dimensionality(_arg)  # type: ignore
-                self.restriction = "dimensions"
-            except ValueError:
-                if self.restriction == "dimensions":
-                    raise
+        # validated quantities of a named registry are pickled by the name of the registry
+        if registry_name(self.ureg) is not None:
+            _register_reducers(self.ureg)
+
+        self.restriction, self.units, self.dimensions = _resolve(
+            self.ureg, _arg, self.restriction
+        )
+
+        # source units -> (factor, offset) for converting to `self.units`
+        # `None` if the conversion must go through Pint (e.g. context transformations)
+        self._conversions: dict[pint.Unit, tuple[Any, Any] | None] = {}
+
+        # source units -> path of dimensions through the context transformations
+        # `None` if the conversion must go through Pint (e.g. no path)
+        self._context_paths: dict[pint.Unit, tuple | None] = {}
+        # contexts resolved into a chain on first use; `None` if Pint must enable them
+        self._chain: ContextChain | None = None
+        self._chain_resolved = False
+
+        # source units -> whether the units have the restricted dimensions
+        self._dimension_index: dict[pint.Unit, bool] = {}
+        # (source units, active contexts) -> whether the units are compatible with the
+        # restricted dimensions through context transformations
+        self._compatible_index: dict[tuple, bool] = {}
 
-        if self.restriction is None:
-            raise ValueError(f"cannot deduce units or dimensions from '{_arg}'")
+        # whether the source type is a list -> core schema
+        self._core_schemas: dict[bool, core_schema.CoreSchema] = {}
 
-        self.units = _units
-        self.dimensions = _dims
+        # (units, unit format) -> rendered units, including the leading separator
+        self._unit_strings: dict[tuple[pint.Unit, str], str | None] = {}
+        # (units, unit format) -> rendered units, for the dict serialization mode
+        self._unit_names: dict[tuple[pint.Unit, str], str] = {}
+
+        # spelling -> resolved units, with the conversion factors memoized up front
+        self.allowed_units = tuple(allowed_units) if allowed_units is not None else None
+        self._allowed_units: dict[str, pint.Unit] | None = None
+        # containers of the allowed units, which can be compared with units of other registries
+        self._allowed_containers: frozenset[UnitsContainer] = frozenset()
+        if self.allowed_units is not None:
+            cache = get_unit_cache(self.ureg)
+            self._allowed_units = {units: cache.get(units) for units in self.allowed_units}
+            self._allowed_containers = frozenset(
+                unit._units for unit in self._allowed_units.values()
+            )
+            if self.restriction == "units" and not self.ureg_contexts:
+                for unit in set(self._allowed_units.values()):
+                    self._conversions[unit] = self._conversion_factor(unit)
+
+        # without metrics, the methods are not wrapped and nothing is counted
+        self.metrics: QuantityMetrics | None = None
+        if metrics:
+            self.metrics = QuantityMetrics(
+                metrics if isinstance(metrics, str) else None,
+                f"{self.units if self.restriction == 'units' else self.dimensions}",
+            )
+            self._conversions = _CountingDict(self.metrics, self._conversions)
+            self.validate = self._validate_with_metrics  # type: ignore[method-assign]
+            self.validate_many = self._validate_many_with_metrics  # type: ignore[method-assign]
+            self.serialize = self._serialize_with_metrics  # type: ignore[method-assign]
+            self.serialize_many = self._serialize_many_with_metrics  # type: ignore[method-assign]
+
+        self._initialized = True
+
+        # interned only once initialized, other threads may get the annotation right away
+        if self._intern_key is not None:
+            PydanticPintQuantity._interned[self._intern_key] = self
+
+    def __reduce__(self):
+        # unit registries cannot be pickled; the annotation is pickled as its arguments
+        # and the name of its registry, and rebuilt with the registry of the same name
+        name = registry_name(self.ureg)
+        if name is None:
+            raise TypeError(
+                "cannot pickle an annotation with an unnamed unit registry; "
+                "see `pydantic_pint.registry.register_registry`"
+            )
+        if not all(isinstance(context, str) for context in self.ureg_contexts):
+            raise TypeError(
+                "cannot pickle an annotation with unit registry context objects; "
+                "use context names instead"
+            )
+
+        args, kwargs = self._init_args
+        return _unpickle_annotation, (name, args, kwargs, self.ureg_contexts)
 
     def validate(
         self,
@@ -140,51 +440,401 @@ class PydanticPintQuantity:
                 - No such units found in registry.
                 - An unknown unit was provided.
                 - An unknown type for value was provided.
+
+                Validation failures are raised as `pydantic_core.PydanticCustomError`,
+                with the error types in `pydantic_pint.errors`.
             TypeError:
                 An error occurred from unit registry or unit registry context.
                 It is not propagated as a `pydantic.ValidationError` because it does not stem from a user error.
         """
-        try:
-            if isinstance(v, dict):
-                v = f"{v['magnitude']} {v.get('units', '')}"
-        except KeyError as e:
-            raise ValueError("no `magnitude` or `units` keys found") from e
+        annotation = self._for_active_registry()
+        if annotation is not self:
+            return annotation.validate(v, info)
+        return self._validate_parsed(self._parse(v))
+
+    def _for_active_registry(self) -> PydanticPintQuantity:
+        # annotations without a registry delegate to the same annotation with the
+        # registry of `use_registry`; interned, so caches are kept per registry
+        if not self._follows_registry:
+            return self
+        registry = _ACTIVE_REGISTRY.get()
+        if registry is None or registry is self.ureg:
+            return self
+
+        # the clones are stored on the registry, they reference the registry and are
+        # dropped with it (or with this annotation)
+        clones = getattr(registry, _REGISTRY_CLONES_ATTR, None)
+        if clones is None:
+            clones = weakref.WeakKeyDictionary()
+            setattr(registry, _REGISTRY_CLONES_ATTR, clones)
 
-        # try converting to a number before parsing expression
-        # required for pint>=0.25.3
         try:
-            v = float(v)
-        except (ValueError, TypeError):
+            return clones[self]
+        except KeyError:
             pass
 
+        # the metrics of this annotation count the delegated values as well
+        args, kwargs = self._init_args
+        kwargs = {name: value for name, value in kwargs.items() if name != "metrics"}
+        annotation = PydanticPintQuantity(
+            *args, ureg=registry, ureg_contexts=self.ureg_contexts, **kwargs
+        )
+        if len(clones) < _MEMO_SIZE:
+            clones[self] = annotation
+        return annotation
+
+    def _validate_with_metrics(
+        self,
+        v: dict | str | Number | Quantity,
+        info: core_schema.ValidationInfo | None = None,
+    ) -> Quantity:
+        metrics: QuantityMetrics = self.metrics  # type: ignore[assignment]
+        start = time.perf_counter()
         try:
-            if isinstance(v, str):
-                # if value is a quantity, then units are present and check on the units being convertible
-                # if value is a number, then check on strict mode will happen next
-                v = self.ureg(v)
-        except pint.PintError as e:
-            raise ValueError(e) from e
+            return PydanticPintQuantity.validate(self, v, info)
+        except (ValueError, TypeError) as e:
+            metrics.record_failure(e)
+            raise
+        finally:
+            metrics.validations += 1
+            metrics.validation_time += time.perf_counter() - start
+
+    def validate_many(
+        self,
+        values: Iterable[dict | str | Number | Quantity] | dict,
+        info: core_schema.ValidationInfo | None = None,
+        *,
+        as_array: bool = False,
+    ) -> list[Quantity] | Quantity:
+        """Validate many values of `PydanticPintQuantity` in one pass.
+
+        Values are grouped by their source units, and each group is converted at once.
+        If `numpy` is installed, a group is converted as a single array.
 
+        Values in the columnar form, `{"units": ..., "magnitudes": [...]}`, share their units.
+        If `numpy` is installed, they are validated as a single quantity with an array magnitude.
+
+        Args:
+            values:
+                The quantities that should be validated, or their columnar form.
+            info:
+                The validation info provided by the Pydantic schema.
+            as_array:
+                Whether or not to return a single quantity with an array magnitude.
+                Requires `numpy` and all validated quantities to have the same units.
+
+        Returns:
+            The validated `pint.Quantity` values with the correct units, in order.
+            If `as_array` is enabled, a single `pint.Quantity` with an array magnitude.
+
+        Raises:
+            ValueError:
+                An error occurred validating one of the values.
+                It is raised as a `pydantic_core.ValidationError` located at the index of the value.
+                See `validate` for more details.
+            TypeError:
+                An error occurred from unit registry or unit registry context.
+        """
+        if as_array and np is None:
+            raise ImportError("numpy is required for array quantities")
+
+        annotation = self._for_active_registry()
+        if annotation is not self:
+            return annotation.validate_many(values, info, as_array=as_array)
+
+        if isinstance(values, dict):
+            return self._validate_columnar(values, as_array=as_array)
+
+        values = values if isinstance(values, list) else list(values)
+        parsed = []
+        for i, v in enumerate(values):
+            try:
+                parsed.append(self._parse(v))
+            except ValueError as e:
+                raise _item_error(i, e, v) from e
+
+        results: list[Any] = [None] * len(parsed)
+
+        # indices of quantities that are converted together, grouped by source units;
+        # quantities of another unit registry are converted by Pint, one at a time
+        groups: dict[pint.Unit, list[int]] = {}
+        for i, v in enumerate(parsed):
+            if (
+                self.restriction == "units" and
+                not self.exact and
+                not self.array and
+                isinstance(v, Quantity) and
+                v._REGISTRY is self.ureg and
+                type(v.magnitude) in (int, float)
+            ):
+                groups.setdefault(v.units, []).append(i)
+            else:
+                results[i] = self._validate_item(i, v, values[i])
+
+        for units, indices in groups.items():
+            try:
+                converted = self._convert_group(units, [parsed[i] for i in indices])
+            except (pint.PintError, ValueError):
+                # validate one at a time to report the failing value
+                converted = [self._validate_item(i, parsed[i], values[i]) for i in indices]
+            for i, v in zip(indices, converted):
+                results[i] = v
+
+        if not as_array:
+            return results
+
+        # units of different registries cannot be compared, their containers can
+        if len({(id(v._REGISTRY), v._units) for v in results}) > 1:
+            raise PydanticCustomError(
+                QUANTITY_ARRAY,
+                "cannot combine quantities with different units into an array",
+            )
+        return self.ureg.Quantity(
+            np.asarray([v.magnitude for v in results]),
+            results[0].units if results else self.units,
+        )
+
+    def _validate_columnar(self, v: dict, *, as_array: bool) -> list[Quantity] | Quantity:
+        if "magnitudes" not in v or not v.get("units"):
+            raise PydanticCustomError(
+                QUANTITY_MISSING_KEYS, "no `magnitudes` or `units` keys found"
+            )
+
+        unit = self._lookup_units(v["units"])
+        magnitudes = v["magnitudes"]
+
+        if np is None or (self.array and not as_array):
+            # array magnitudes are validated one at a time
+            return self.validate_many([self.ureg.Quantity(m, unit) for m in magnitudes])
+
+        validated = self._validate_parsed(self.ureg.Quantity(np.asarray(magnitudes), unit))
+        if as_array:
+            return validated
+        return [self.ureg.Quantity(m, validated.units) for m in validated.magnitude.tolist()]
+
+    def _validate_many_with_metrics(
+        self,
+        values: Iterable[dict | str | Number | Quantity] | dict,
+        info: core_schema.ValidationInfo | None = None,
+        *,
+        as_array: bool = False,
+    ) -> list[Quantity] | Quantity:
+        metrics: QuantityMetrics = self.metrics  # type: ignore[assignment]
+        if isinstance(values, dict):
+            count = len(values.get("magnitudes", ()))
+        else:
+            values = list(values)
+            count = len(values)
+
+        start = time.perf_counter()
+        try:
+            return PydanticPintQuantity.validate_many(self, values, info, as_array=as_array)
+        except (ValueError, TypeError) as e:
+            metrics.record_failure(e)
+            raise
+        finally:
+            metrics.validations += count
+            metrics.validation_time += time.perf_counter() - start
+
+    def _validate_item(self, i: int, v: Number | Quantity, value: Any) -> Quantity:
+        try:
+            return self._validate_parsed(v)
+        except ValueError as e:
+            raise _item_error(i, e, value) from e
+
+    def _convert_group(self, units: pint.Unit, values: list[Quantity]) -> list[Quantity]:
+        if units == self.units:
+            return values
+
+        if np is None:
+            return [self._convert(v) for v in values]
+
+        magnitudes = np.asarray([v.magnitude for v in values])
+        converted = self._convert(self.ureg.Quantity(magnitudes, units))
+        return [self.ureg.Quantity(m, self.units) for m in converted.magnitude.tolist()]
+
+    def _parse(self, v: dict | str | Number | Quantity) -> Number | Quantity:
+        # dispatch on the type of the value, without raising on the common paths
+        if isinstance(v, Quantity):
+            if self._allowed_units is not None and v._units not in self._allowed_containers:
+                raise self._not_allowed_error()
+            return v
+
+        if isinstance(v, dict):
+            v = self._parse_mapping(v)
+
+        if isinstance(v, str):
+            # if value is a quantity, then units are present and check on the units being convertible
+            # if value is a number, then check on strict mode will happen next
+            return self._parse_string(v)
+
+        if self.array and isinstance(v, (list, tuple, np.ndarray)):
+            # bare array magnitudes are treated like numbers without units
+            if self.strict or self.restriction == "dimensions":
+                raise PydanticCustomError(
+                    QUANTITY_STRICT, "must specify units with 'strict' flag enabled"
+                )
+            v = self.ureg.Quantity(self._validate_array(v), self.units)
+
+        return v
+
+    def _validate_parsed(self, v: Number | Quantity) -> Quantity:
         try:
             if self.restriction == "units":
-                return self._validate_units(v)
+                v = self._validate_units(v)
             elif self.restriction == "dimensions":
-                return self._validate_dimensions(v)
+                v = self._validate_dimensions(v)
             else:
                 raise ValueError(f"unknown restrictions '{self.restriction}'")
+
+            if self.array:
+                v = self.ureg.Quantity(self._validate_array(v.magnitude), v.units)
+            return v
         except AttributeError as e:
             # raises attribute error if value is a number
             # this case only happes when parsing from a string, the units are not present, and not in strict mode
             # see comments above related to ureg returning a number
-            raise ValueError("no units found") from e
+            raise PydanticCustomError(QUANTITY_STRICT, "no units found") from e
         except pint.DimensionalityError as e:
-            raise ValueError(e) from e
+            raise _pint_error(e) from e
         except KeyError as e:
             # this should not be considered a validation error
             # raising a type error with extra information
             raise TypeError(f"unknown unit registry context {e}") from e
 
-        raise ValueError(f"unknown error: {v=} | {type(v)=}")
+    def _validate_array(self, v: Any) -> np.ndarray:
+        magnitude = np.asarray(v)
+        if magnitude.ndim == 0:
+            raise PydanticCustomError(
+                QUANTITY_ARRAY, "array magnitude must have at least one dimension"
+            )
+
+        if magnitude.dtype.kind not in "biuf":
+            raise PydanticCustomError(
+                QUANTITY_ARRAY,
+                "array magnitude must be numeric, got '{dtype}'",
+                {"dtype": magnitude.dtype},
+            )
+
+        if self.dtype is not None and magnitude.dtype != self.dtype:
+            try:
+                magnitude = magnitude.astype(self.dtype, casting="same_kind")
+            except TypeError as e:
+                raise PydanticCustomError(
+                    QUANTITY_ARRAY,
+                    "cannot cast array magnitude from '{dtype}' to '{expected_dtype}'",
+                    {"dtype": magnitude.dtype, "expected_dtype": self.dtype},
+                ) from e
+
+        if self.shape is not None and (
+            magnitude.ndim != len(self.shape) or
+            any(n is not None and n != m for n, m in zip(self.shape, magnitude.shape))
+        ):
+            raise PydanticCustomError(
+                QUANTITY_ARRAY,
+                "array magnitude must have shape {expected_shape}, got {shape}",
+                {"shape": magnitude.shape, "expected_shape": self.shape},
+            )
+
+        return magnitude
+
+    def _parse_mapping(self, v: dict) -> str | Number | Quantity:
+        # numeric magnitudes are combined with the cached units directly
+        # string magnitudes are parsed together with the units
+        if "magnitude" in v:
+            magnitude = v["magnitude"]
+        elif self.array and "magnitudes" in v:
+            # columnar form of an array magnitude
+            magnitude = v["magnitudes"]
+        else:
+            raise PydanticCustomError(
+                QUANTITY_MISSING_KEYS, "no `magnitude` or `units` keys found"
+            )
+
+        units = v.get("units") or ""
+        if isinstance(magnitude, str):
+            return f"{magnitude} {units}"
+        if not units:
+            return magnitude
+        if self.array and isinstance(magnitude, (list, tuple, np.ndarray)):
+            magnitude = self._validate_array(magnitude)
+
+        if self._allowed_units is not None:
+            return self.ureg.Quantity(magnitude, self._allowed_unit(units))
+
+        try:
+            unit = get_unit_cache(self.ureg).get(units)
+        except (TypeError, ValueError):
+            # units with a scaling factor or additive expressions, e.g. "m / (2 s)"
+            return f"{magnitude} {units}"
+        except pint.PintError as e:
+            raise _pint_error(e) from e
+        return self.ureg.Quantity(magnitude, unit)
+
+    def _parse_string(self, v: str) -> Number | Quantity:
+        # "<number> <units>" strings are split with a compiled pattern, only the magnitude
+        # is parsed and the units are resolved through the unit cache of the registry
+        # full expressions (e.g. "3 m / (2 s)") fall back to the Pint parser
+        match = _QUANTITY_STRING.fullmatch(v)
+        if match is None:
+            if self._allowed_units is not None:
+                raise self._not_allowed_error()
+            return self._parse_expression(v)
+
+        magnitude, units = match.groups()
+        if not units:
+            # numbers are not parsed by the unit registry
+            # required for pint>=0.25.3
+            return float(magnitude)
+
+        if self._allowed_units is not None:
+            unit = self._allowed_unit(units)
+        else:
+            try:
+                unit = get_unit_cache(self.ureg).get(units)
+            except pint.UndefinedUnitError as e:
+                # undefined units are not defined in an expression either; repeated
+                # unknown units are rejected by the unit cache without parsing them
+                raise _pint_error(e) from e
+            except (pint.PintError, TypeError, ValueError):
+                # e.g. additive expressions, "1 m + 2 cm"
+                return self._parse_expression(v)
+
+        if magnitude.lstrip("+-").isdigit():
+            return self.ureg.Quantity(int(magnitude), unit)
+        return self.ureg.Quantity(self.ureg.non_int_type(magnitude), unit)
+
+    def _lookup_units(self, units: str) -> pint.Unit:
+        if self._allowed_units is not None:
+            return self._allowed_unit(units)
+        try:
+            return get_unit_cache(self.ureg).get(units)
+        except pint.PintError as e:
+            raise _pint_error(e) from e
+        except (TypeError, ValueError) as e:
+            # expressions that are not plain units, e.g. "m + cm"
+            raise PydanticCustomError(
+                QUANTITY_PARSING, "invalid units '{units}'", {"units": units}
+            ) from e
+
+    def _allowed_unit(self, units: str) -> pint.Unit:
+        unit = self._allowed_units.get(units)  # type: ignore[union-attr]
+        if unit is None:
+            raise self._not_allowed_error()
+        return unit
+
+    def _not_allowed_error(self) -> PydanticCustomError:
+        return PydanticCustomError(
+            QUANTITY_NOT_ALLOWED,
+            "units must be one of: {allowed_units}",
+            {"allowed_units": ", ".join(self.allowed_units)},  # type: ignore[arg-type]
+        )
+
+    def _parse_expression(self, v: str) -> Number | Quantity:
+        try:
+            return self.ureg(v)
+        except pint.PintError as e:
+            raise _pint_error(e) from e
 
     def _validate_units(self, v: Number | Quantity):
         if self.units is None:
@@ -193,16 +843,178 @@ class PydanticPintQuantity:
         if not self.strict and isinstance(v, Number):
             return self.ureg.Quantity(v, self.units)
         elif self.strict and isinstance(v, Number):
-            raise ValueError(f"must specify units with 'strict' flag enabled")
+            raise PydanticCustomError(
+                QUANTITY_STRICT, "must specify units with 'strict' flag enabled"
+            )
         elif not self.exact and isinstance(v, Quantity):
-            return v.to(self.units, *self.ureg_contexts)
+            return self._convert(v)
         elif self.exact and isinstance(v, Quantity):
             if self.units == v.units:
                 return v
-            raise ValueError(f"must specify exact units: '{self.units}'")
+            raise PydanticCustomError(
+                QUANTITY_EXACT, "must specify exact units: '{units}'", {"units": self.units}
+            )
         else:
             raise ValueError(f"unknown error: value type '{type(v)}'")
 
+    def _convert(self, v: Quantity) -> Quantity:
+        # quantities of another unit registry are converted by Pint, in their registry
+        if v._REGISTRY is not self.ureg:
+            return v.to(self.units, *self.ureg_contexts)
+
+        # values already in the field units are returned as is
+        if v.units == self.units:
+            return v
+
+        if self.ureg_contexts:
+            return self._convert_in_contexts(v)
+
+        if isinstance(v.magnitude, (Decimal, Fraction)):
+            return v.to(self.units)
+
+        return self._convert_by_factor(v)
+
+    def _convert_by_factor(self, v: Quantity) -> Quantity:
+        # conversions without contexts are a scale factor (and an offset for
+        # non-multiplicative units), memoized the first time a source unit is seen
+        units = v.units
+        magnitude = v.magnitude
+        try:
+            conversion = self._conversions[units]
+        except KeyError:
+            conversion = self._conversion_factor(units)
+            if len(self._conversions) < _MEMO_SIZE:
+                self._conversions[units] = conversion
+
+        if conversion is None:
+            return v.to(self.units)
+
+        factor, offset = conversion
+        if offset is None:
+            return self.ureg.Quantity(magnitude * factor, self.units)
+        return self.ureg.Quantity(magnitude * factor + offset, self.units)
+
+    def _convert_in_contexts(self, v: Quantity) -> Quantity:
+        # the contexts are resolved once, and the path of context transformations is
+        # memoized per source unit; the transformed value is then converted without
+        # contexts, instead of enabling the contexts in the registry for every value
+        chain = self._contexts_chain()
+        # the contexts enabled in the registry (a private attribute of Pint); without it,
+        # the contexts cannot be applied on top of the enabled ones
+        active_contexts = getattr(self.ureg, "_active_ctx", None)
+        if (
+            chain is None or
+            active_contexts is None or
+            active_contexts or
+            isinstance(v.magnitude, (Decimal, Fraction))
+        ):
+            return v.to(self.units, *self.ureg_contexts)
+
+        units = v.units
+        try:
+            path = self._context_paths[units]
+        except KeyError:
+            path = self._context_path(chain, units)
+            if len(self._context_paths) < _MEMO_SIZE:
+                self._context_paths[units] = path
+
+        if path is None:
+            return v.to(self.units, *self.ureg_contexts)
+
+        try:
+            transformed = v
+            for src, dst in zip(path[:-1], path[1:]):
+                transformed = chain.transform(src, dst, self.ureg, transformed)
+        except AttributeError:
+            # Pint internals differ between versions
+            return v.to(self.units, *self.ureg_contexts)
+
+        if transformed.units == self.units:
+            return transformed
+        return self._convert_by_factor(transformed)
+
+    def _contexts_chain(self) -> ContextChain | None:
+        if self._chain_resolved:
+            return self._chain
+
+        # the chain relies on Pint internals (the contexts of the registry, the context chain,
+        # and the transformations expressed in base dimensions when the contexts are enabled);
+        # without them, values are converted by Pint with the contexts enabled
+        chain = None
+        try:
+            # enabling the contexts once expresses their transformations in base dimensions
+            with self.ureg.context(*self.ureg_contexts):
+                pass
+            contexts = [
+                self.ureg._contexts[c] if isinstance(c, str) else c
+                for c in self.ureg_contexts
+            ]
+            # redefined units change conversions; always go through Pint
+            if not any(ctx.redefinitions for ctx in contexts):
+                chain = ContextChain()
+                chain.insert_contexts(*contexts)
+        except (KeyError, AttributeError, TypeError):
+            # unknown contexts are reported by Pint, as are missing internals of older versions
+            chain = None
+
+        # the chain is set before it is marked resolved, for concurrent validation
+        self._chain = chain
+        self._chain_resolved = True
+        return chain
+
+    def _context_path(self, chain: ContextChain, units: pint.Unit) -> tuple | None:
+        src_dims = units.dimensionality
+        dst_dims = self.units.dimensionality
+        if src_dims == dst_dims:
+            return ()
+
+        try:
+            path = find_shortest_path(chain.graph, src_dims, dst_dims)
+        except AttributeError:
+            # Pint internals differ between versions
+            return None
+        return tuple(path) if path else None
+
+    def _conversion_factor(self, units: pint.Unit) -> tuple[Any, Any] | None:
+        if units.dimensionality != self.units.dimensionality:
+            # only reachable through context transformations
+            return None
+
+        if not (self._is_linear(units) and self._is_linear(self.units)):
+            # e.g. logarithmic units, converted by Pint
+            return None
+
+        try:
+            zero = self.ureg.Quantity(0, units)
+            one = self.ureg.Quantity(1, units)
+            # difference of quantities is in delta units for non-multiplicative units
+            delta_units = (
+                self.ureg.Quantity(1, self.units) - self.ureg.Quantity(0, self.units)
+            ).units
+            factor = (one - zero).to(delta_units).magnitude
+            offset = zero.to(self.units).magnitude
+        except pint.PintError:
+            return None
+
+        return factor, (offset if offset != 0 else None)
+
+    def _is_linear(self, units: pint.Unit) -> bool:
+        # whether the units are converted with a scale factor and an offset
+        definitions = getattr(self.ureg, "_units", None)
+        if definitions is None:
+            return False
+        for name in units._units:
+            definition = definitions.get(name)
+            if definition is None:
+                return False
+            converter = definition.converter
+            # logarithmic converters are scale converters in Pint
+            if isinstance(converter, LogarithmicConverter) or not isinstance(
+                converter, (ScaleConverter, OffsetConverter)
+            ):
+                return False
+        return True
+
     def _validate_dimensions(self, v: Number | Quantity):
         if self.dimensions is None:
             raise TypeError(
@@ -210,23 +1022,71 @@ class PydanticPintQuantity:
             )
 
         if isinstance(v, Number):
-            raise ValueError(f"must specify units with dimension restriction")
+            raise PydanticCustomError(
+                QUANTITY_STRICT, "must specify units with dimension restriction"
+            )
         elif not self.exact and isinstance(v, Quantity):
-            if (
-                v.check(self.dimensions) or
-                any(v.is_compatible_with(dim) for dim in
-                    self.ureg._cache.dimensional_equivalents.get(self.dimensions, [])
-                )
-            ):
+            if self._is_compatible(v.units):
                 return v
-            raise ValueError(f"cannot convert to dimension '{self.dimensions}'")
+            raise PydanticCustomError(
+                QUANTITY_DIMENSIONALITY,
+                "cannot convert to dimension '{dimensions}'",
+                {"dimensions": self.dimensions},
+            )
         elif self.exact and isinstance(v, Quantity):
-            if v.check(self.dimensions):
+            if self._has_dimensions(v.units):
                 return v
-            raise ValueError(f"must specify exact dimensions: '{self.dimensions}'")
+            raise PydanticCustomError(
+                QUANTITY_EXACT,
+                "must specify exact dimensions: '{dimensions}'",
+                {"dimensions": self.dimensions},
+            )
         else:
             raise ValueError(f"unknown error: value type '{type(v)}'")
 
+    def _has_dimensions(self, units: pint.Unit) -> bool:
+        if units._REGISTRY is not self.ureg:
+            # units of another unit registry have the dimensions defined in their registry
+            return units.dimensionality == self.dimensions
+
+        try:
+            return self._dimension_index[units]
+        except KeyError:
+            pass
+
+        result = units.dimensionality == self.dimensions
+        if len(self._dimension_index) < _MEMO_SIZE:
+            self._dimension_index[units] = result
+        return result
+
+    def _is_compatible(self, units: pint.Unit) -> bool:
+        if self._has_dimensions(units):
+            return True
+
+        # units of other dimensions are only compatible through active contexts
+        active_contexts = getattr(self.ureg, "_active_ctx", None)
+        if not active_contexts or units._REGISTRY is not self.ureg:
+            return False
+
+        key = (units, active_contexts.hashable())
+        try:
+            return self._compatible_index[key]
+        except KeyError:
+            pass
+
+        # any unit of the restricted dimensions decides the compatibility
+        unit = next(
+            (
+                unit for unit in self.ureg.get_compatible_units(self.dimensions)
+                if unit.dimensionality == self.dimensions
+            ),
+            None,
+        )
+        result = unit is not None and self.ureg.Quantity(1, units).is_compatible_with(unit)
+        if len(self._compatible_index) < _MEMO_SIZE:
+            self._compatible_index[key] = result
+        return result
+
     def serialize(
         self,
         v: Quantity,
@@ -248,25 +1108,163 @@ class PydanticPintQuantity:
         Returns:
             The serialized `pint.Quantity`.
         """
+        annotation = self._for_active_registry()
+        if annotation is not self:
+            return annotation.serialize(v, info, to_json=to_json)
+
         to_json = to_json or (info is not None and info.mode_is_json())
 
-        if self.ser_mode == "dict":
-            return {
-                "magnitude": v.magnitude,
-                "units": v.units if not to_json else f"{v.units}",
-            }
+        magnitude = v.magnitude
+        if to_json and hasattr(magnitude, "tolist"):
+            # array magnitudes are converted to (nested) lists in one call
+            magnitude = magnitude.tolist()
+
+        if (
+            self.ser_mode == "dict" or
+            self.ser_mode == "columnar" or
+            # the string form of an array magnitude cannot be validated again
+            (to_json and self.array and self.ser_mode is None)
+        ):
+            units = v.units if not to_json else self._format_units(v.units)
+            if self.ser_mode == "columnar" and self.array:
+                return {"units": units, "magnitudes": magnitude}
+            return {"magnitude": magnitude, "units": units}
 
         if self.ser_mode == "number":
-            return v.magnitude
+            return magnitude
 
         # special case when no serialization mode is specified, but
         # need to serialize to a json convertible object
         if self.ser_mode == "str" or to_json:
-            return f"{v}"
+            return self._format(v)
 
         # return the `pint.Quanity` object as is (no serialization)
         return v
 
+    def _serialize_with_metrics(
+        self,
+        v: Quantity,
+        info: core_schema.SerializationInfo | None = None,
+        *,
+        to_json: bool = False,
+    ) -> dict | str | Number | Quantity:
+        metrics: QuantityMetrics = self.metrics  # type: ignore[assignment]
+        start = time.perf_counter()
+        try:
+            return PydanticPintQuantity.serialize(self, v, info, to_json=to_json)
+        finally:
+            metrics.serializations += 1
+            metrics.serialization_time += time.perf_counter() - start
+
+    def _format(self, v: Quantity) -> str:
+        if v._REGISTRY is not self.ureg:
+            # quantities of another unit registry are formatted by Pint, with its default format
+            return format(v, (self.float_format or "") + _default_format(v._REGISTRY))
+
+        spec = _default_format(self.ureg)
+        magnitude = v.magnitude
+        if type(magnitude) not in (int, float) or spec.replace("~", "") not in ("", "D"):
+            # formats that render the magnitude themselves (e.g. pretty, LaTeX, HTML)
+            return format(v, (self.float_format or "") + spec)
+
+        key = (v.units, spec)
+        try:
+            units = self._unit_strings[key]
+        except KeyError:
+            units = self._unit_string(v.units, spec)
+            if len(self._unit_strings) < _MEMO_SIZE:
+                self._unit_strings[key] = units
+
+        if units is None:
+            return format(v, (self.float_format or "") + spec)
+
+        if self.float_format and type(magnitude) is float:
+            return format(magnitude, self.float_format) + units
+        return repr(magnitude) + units
+
+    def _format_units(self, units: pint.Unit) -> str:
+        if units._REGISTRY is not self.ureg:
+            return f"{units}"
+
+        key = (units, _default_format(self.ureg))
+        try:
+            return self._unit_names[key]
+        except KeyError:
+            pass
+
+        name = f"{units}"
+        if len(self._unit_names) < _MEMO_SIZE:
+            self._unit_names[key] = name
+        return name
+
+    def _unit_string(self, units: pint.Unit, spec: str) -> str | None:
+        # the units are rendered once with a unit magnitude and reused as a suffix
+        rendered = format(self.ureg.Quantity(1, units), spec)
+        return rendered[1:] if rendered.startswith("1") else None
+
+    def serialize_many(
+        self,
+        values: Iterable[Quantity],
+        info: core_schema.SerializationInfo | None = None,
+        *,
+        to_json: bool = False,
+    ) -> list[dict | str | Number | Quantity] | dict:
+        """Serialize many values of `PydanticPintQuantity`.
+
+        In the `"columnar"` serialization mode, values sharing the same units are serialized to
+        `{"units": ..., "magnitudes": [...]}`; otherwise, each value is serialized to a `dict`.
+
+        Args:
+            values:
+                The quantities that should be serialized.
+            info:
+                The serialization info provided by the Pydantic schema.
+            to_json:
+                Whether or not to serialize to a json convertible object.
+
+        Returns:
+            The serialized `pint.Quantity` values, in order.
+        """
+        annotation = self._for_active_registry()
+        if annotation is not self:
+            return annotation.serialize_many(values, info, to_json=to_json)
+
+        to_json = to_json or (info is not None and info.mode_is_json())
+
+        if self.ser_mode == "columnar":
+            values = list(values)
+            # units of different registries cannot be compared, their containers can
+            units = {v._units for v in values}
+            if len(units) == 1 and len({id(v._REGISTRY) for v in values}) == 1:
+                unit = values[0].units
+                magnitudes = [v.magnitude for v in values]
+                if to_json and self.array:
+                    magnitudes = [m.tolist() for m in magnitudes]
+                return {
+                    "units": unit if not to_json else self._format_units(unit),
+                    "magnitudes": magnitudes,
+                }
+
+        # not `self.serialize`, which counts each value again when collecting metrics
+        serialize = PydanticPintQuantity.serialize
+        return [serialize(self, v, to_json=to_json) for v in values]
+
+    def _serialize_many_with_metrics(
+        self,
+        values: Iterable[Quantity],
+        info: core_schema.SerializationInfo | None = None,
+        *,
+        to_json: bool = False,
+    ) -> list[dict | str | Number | Quantity] | dict:
+        metrics: QuantityMetrics = self.metrics  # type: ignore[assignment]
+        values = list(values)
+        start = time.perf_counter()
+        try:
+            return PydanticPintQuantity.serialize_many(self, values, info, to_json=to_json)
+        finally:
+            metrics.serializations += len(values)
+            metrics.serialization_time += time.perf_counter() - start
+
     def __get_pydantic_core_schema__(
         self,
         source_type: Any,
@@ -274,6 +1272,9 @@ class PydanticPintQuantity:
     ) -> core_schema.CoreSchema:
         """Gets the Pydantic core schema.
 
+        If the source type is a `list`, the whole list is validated at once with `validate_many`,
+        e.g. `Annotated[list[Quantity], PydanticPintQuantity("m/s")]`.
+
         Args:
             source_type:
                 The source type.
@@ -283,66 +1284,191 @@ class PydanticPintQuantity:
         Returns:
             The Pydantic core schema.
         """
-        _from_typedict_schema = {
-            "magnitude": core_schema.typed_dict_field(
-                core_schema.str_schema(coerce_numbers_to_str=True),
-            ),
-            "units": core_schema.typed_dict_field(
-                core_schema.str_schema(),
-                required=False,
-            ),
-        }
+        _is_list = source_type is list or get_origin(source_type) is list
+
+        try:
+            return self._core_schemas[_is_list].copy()
+        except KeyError:
+            pass
+
+        schema = self._build_core_schema(_is_list)
+        self._core_schemas[_is_list] = schema
+        return schema.copy()
+
+    def _build_core_schema(self, _is_list: bool) -> core_schema.CoreSchema:
+        # strict, booleans are not magnitudes
+        _magnitude_schemas = [
+            core_schema.int_schema(strict=True),
+            core_schema.float_schema(strict=True),
+            core_schema.str_schema(),
+        ]
+
+        # array magnitudes are accepted as (nested) lists, or arrays in python mode
+        _array_json_schemas = []
+        _array_python_schemas = []
+        if self.array:
+            _array_json_schemas = [core_schema.list_schema()]
+            _array_python_schemas = [
+                core_schema.list_schema(),
+                core_schema.is_instance_schema(np.ndarray),
+            ]
+
+        # allowed units are checked natively and advertised as an enum
+        _units_schema = (
+            core_schema.literal_schema(list(self.allowed_units))
+            if self.allowed_units is not None else
+            core_schema.str_schema()
+        )
+
+        def _from_typedict_schema(array_schemas):
+            return core_schema.typed_dict_schema(
+                {
+                    "magnitude": core_schema.typed_dict_field(
+                        core_schema.union_schema([*_magnitude_schemas, *array_schemas]),
+                    ),
+                    "units": core_schema.typed_dict_field(
+                        _units_schema,
+                        required=False,
+                    ),
+                }
+            )
 
-        validate_schema = core_schema.chain_schema(
+        def _from_columnar_schema(magnitudes_schemas):
+            return core_schema.typed_dict_schema(
+                {
+                    "units": core_schema.typed_dict_field(_units_schema),
+                    "magnitudes": core_schema.typed_dict_field(
+                        core_schema.union_schema(magnitudes_schemas),
+                    ),
+                }
+            )
+
+        # numbers are validated natively and not coerced to strings
+        # other number types (e.g. `Decimal`) are still coerced to strings
+        _number_schemas = [
+            core_schema.int_schema(strict=True),
+            core_schema.float_schema(strict=True),
+        ]
+        # only fields accepting numbers without units validate them natively;
+        # otherwise, numbers are coerced to strings and rejected in validation
+        _accepts_numbers = not self.strict and self.restriction == "units"
+        _input_number_schemas = _number_schemas if _accepts_numbers else []
+
+        # the columnar form of an array magnitude
+        _columnar_json_schemas = []
+        _columnar_python_schemas = []
+        if self.ser_mode == "columnar" and self.array and not _is_list:
+            _columnar_json_schemas = [_from_columnar_schema(_array_json_schemas)]
+            _columnar_python_schemas = [_from_columnar_schema(_array_python_schemas)]
+
+        _input_schema = core_schema.union_schema(
             [
-                core_schema.union_schema(
-                    [
-                        core_schema.is_instance_schema(Quantity),
-                        core_schema.str_schema(coerce_numbers_to_str=True),
-                        core_schema.typed_dict_schema(_from_typedict_schema),
-                    ]
-                ),
-                core_schema.with_info_before_validator_function(
-                    self.validate,
-                    core_schema.is_instance_schema(Quantity),
-                ),
+                core_schema.is_instance_schema(Quantity),
+                *_input_number_schemas,
+                core_schema.str_schema(coerce_numbers_to_str=True),
+                _from_typedict_schema(_array_python_schemas),
+                *_columnar_python_schemas,
+                *_array_python_schemas,
             ]
         )
 
-        validate_json_schema = core_schema.chain_schema(
+        _input_json_schema = core_schema.union_schema(
             [
-                core_schema.union_schema(
-                    [
-                        core_schema.str_schema(coerce_numbers_to_str=True),
-                        core_schema.typed_dict_schema(_from_typedict_schema),
-                    ]
-                ),
-                core_schema.with_info_before_validator_function(
-                    self.validate,
-                    core_schema.any_schema(),
-                ),
+                *_input_number_schemas,
+                core_schema.str_schema(coerce_numbers_to_str=not _accepts_numbers),
+                _from_typedict_schema(_array_json_schemas),
+                *_columnar_json_schemas,
+                *_array_json_schemas,
             ]
         )
 
-        if self.ser_mode == "dict":
+        if _is_list:
+            _list_schemas = [core_schema.list_schema(_input_schema)]
+            _list_json_schemas = [core_schema.list_schema(_input_json_schema)]
+            if self.ser_mode == "columnar":
+                # the columnar form of a list of quantities
+                # magnitudes are given as a list, or an array in python mode
+                _magnitudes_schema = core_schema.list_schema(
+                    core_schema.union_schema(
+                        _array_json_schemas if self.array else _number_schemas
+                    )
+                )
+                _magnitudes_python_schemas = [_magnitudes_schema]
+                if np is not None and not self.array:
+                    _magnitudes_python_schemas.append(core_schema.is_instance_schema(np.ndarray))
+
+                _list_schemas.append(_from_columnar_schema(_magnitudes_python_schemas))
+                _list_json_schemas.append(_from_columnar_schema([_magnitudes_schema]))
+
+            validate_schema = core_schema.with_info_after_validator_function(
+                self.validate_many,
+                core_schema.union_schema(_list_schemas),
+            )
+            validate_json_schema = core_schema.with_info_after_validator_function(
+                self.validate_many,
+                core_schema.union_schema(_list_json_schemas),
+            )
+        else:
+            validate_schema = core_schema.with_info_after_validator_function(
+                self.validate,
+                _input_schema,
+            )
+            validate_json_schema = core_schema.with_info_after_validator_function(
+                self.validate,
+                _input_json_schema,
+            )
+
+        if self.array:
+            _ser_magnitude_schema = core_schema.list_schema()
+        elif self.ser_mode == "columnar":
+            # checked against the columnar form, where integers are not coerced to floats
+            _ser_magnitude_schema = core_schema.union_schema(
+                [core_schema.int_schema(), core_schema.float_schema()]
+            )
+        else:
+            _ser_magnitude_schema = core_schema.float_schema()
+
+        _ser_columnar_schema = core_schema.typed_dict_schema(
+            {
+                "units": core_schema.typed_dict_field(core_schema.str_schema()),
+                "magnitudes": core_schema.typed_dict_field(core_schema.list_schema()),
+            }
+        )
+
+        if self.ser_mode == "columnar" and self.array:
+            _ser_return_schema = _ser_columnar_schema
+        elif self.ser_mode in ("dict", "columnar") or (self.array and self.ser_mode is None):
             _ser_return_schema = core_schema.typed_dict_schema(
                 {
-                    "magnitude": core_schema.typed_dict_field(core_schema.float_schema()),
+                    "magnitude": core_schema.typed_dict_field(_ser_magnitude_schema),
                     "units": core_schema.typed_dict_field(core_schema.str_schema()),
                 }
             )
         elif self.ser_mode == "number":
-            _ser_return_schema = core_schema.float_schema()
+            _ser_return_schema = _ser_magnitude_schema
         else:
             # self.ser_mode == "str"
             # serialization defaults to `str` in JSON serialization mode
             _ser_return_schema = core_schema.str_schema()
 
-        serialize_schema = core_schema.plain_serializer_function_ser_schema(
-            self.serialize,
-            info_arg=True,
-            return_schema=_ser_return_schema,
-        )
+        if _is_list:
+            serialize_schema = core_schema.plain_serializer_function_ser_schema(
+                self.serialize_many,
+                info_arg=True,
+                return_schema=(
+                    core_schema.union_schema(
+                        [_ser_columnar_schema, core_schema.list_schema(_ser_return_schema)]
+                    )
+                    if self.ser_mode == "columnar" else
+                    core_schema.list_schema(_ser_return_schema)
+                ),
+            )
+        else:
+            serialize_schema = core_schema.plain_serializer_function_ser_schema(
+                self.serialize,
+                info_arg=True,
+                return_schema=_ser_return_schema,
+            )
 
         return core_schema.json_or_python_schema(
             json_schema=validate_json_schema,
@@ -2,34 +2,401 @@
 
 from __future__ import annotations
 
+import contextlib
+import copyreg
+import os
+import threading
+import time
+import weakref
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
 import pint
 
+from pydantic_pint.cache import clear_unit_caches, get_unit_cache
+
 __all__ = [
     "app_registry",
+    "create_registry",
     "get_registry",
+    "is_registry_ready",
+    "lookup_registry",
+    "register_registry",
+    "registry_generation",
+    "registry_load_time",
+    "registry_name",
     "set_registry",
+    "use_registry",
+    "wait_registry_ready",
+    "warm_registry",
 ]
 
 
-_DEFAULT_REGISTRY: pint.LazyRegistry = pint.LazyRegistry()
+CACHE_FOLDER_ENV = "PYDANTIC_PINT_CACHE_FOLDER"
+"""Environment variable with the cache folder of the default registry definitions."""
+
+
+def _cache_folder(cache_folder: str | Path) -> str | Path:
+    if cache_folder == ":auto:":
+        # the user cache folder, resolved and managed by Pint
+        return cache_folder
+
+    # parsed definitions are only valid for the version of Pint that parsed them
+    return Path(cache_folder) / f"pint-{pint.__version__}"
+
+
+def _default_registry_kwargs() -> dict[str, Any]:
+    cache_folder = os.environ.get(CACHE_FOLDER_ENV)
+    if not cache_folder:
+        return {}
+    return {"cache_folder": _cache_folder(cache_folder)}
+
+
+_DEFAULT_REGISTRY: pint.LazyRegistry = pint.LazyRegistry(
+    kwargs=_default_registry_kwargs()
+)
 
 app_registry = pint.ApplicationRegistry(_DEFAULT_REGISTRY)
 """Pydantic Pint default application registry."""
 
 
+def create_registry(
+    *definitions: str | Path | Iterable[str],
+    cache_folder: str | Path | None = None,
+    **kwargs: Any,
+) -> pint.UnitRegistry:
+    """Create a unit registry, caching the parsed definitions on disk.
+
+    The parsed definitions are stored in the cache folder, per version of Pint and keyed on the hash of the
+    definitions files. Later processes load the parsed definitions instead of parsing the files again.
+    The default registry uses the cache folder from the `PYDANTIC_PINT_CACHE_FOLDER` environment variable.
+
+    Args:
+        definitions:
+            Custom definitions files (or lists of definition lines) loaded into the registry.
+            Definition lines are not cached.
+        cache_folder:
+            The folder to store the parsed definitions.
+            Use `":auto:"` for the user cache folder of Pint; no caching if `None`.
+        kwargs:
+            Additional arguments for `pint.UnitRegistry`.
+
+    Returns:
+        The unit registry.
+    """
+    if cache_folder is not None:
+        kwargs["cache_folder"] = _cache_folder(cache_folder)
+
+    registry = pint.UnitRegistry(**kwargs)
+    for definition in definitions:
+        if isinstance(definition, (str, Path)):
+            registry.load_definitions(definition)
+        else:
+            registry.load_definitions(list(definition))
+
+    return registry
+
+
+# serializes swapping the global registry; reading it does not take the lock
+_REGISTRY_SET_LOCK = threading.Lock()
+_REGISTRY_GENERATION = 0
+
+# the default registry is loaded on first use, once, by a single thread
+_DEFAULT_LOAD_LOCK = threading.Lock()
+_DEFAULT_LOADED = False
+
+# registry overriding the global registry in the current context, see `use_registry`
+_ACTIVE_REGISTRY: ContextVar[pint.UnitRegistry | None] = ContextVar(
+    "pydantic_pint_active_registry", default=None
+)
+
+
 def get_registry() -> pint.UnitRegistry:
     """Get the Pydantic Pint global registry.
 
+    The default registry is loaded on first use; concurrent callers wait until it is loaded.
+
     Returns:
-        The current global registry.
+        The registry set with `use_registry` in the current context, otherwise the current global registry.
+    """
+    registry = _ACTIVE_REGISTRY.get()
+    if registry is not None:
+        return registry
+    return _global_registry()
+
+
+@contextlib.contextmanager
+def use_registry(registry: pint.UnitRegistry) -> Iterator[pint.UnitRegistry]:
+    """Override the Pydantic Pint global registry in the current context.
+
+    The override is scoped with `contextvars`, i.e. per thread and per `asyncio` task.
+    Annotations created without a `ureg` validate and serialize with the overriding registry,
+    e.g. to validate the requests of each tenant with their own unit definitions using a single model.
+
+    Args:
+        registry: The unit registry used in the context.
+
+    Yields:
+        The unit registry.
     """
-    return app_registry.get()
+    token = _ACTIVE_REGISTRY.set(registry)
+    try:
+        yield registry
+    finally:
+        _ACTIVE_REGISTRY.reset(token)
+
+
+def _global_registry() -> pint.UnitRegistry:
+    registry = app_registry.get()
+    if registry is _DEFAULT_REGISTRY and not _DEFAULT_LOADED:
+        _load_default_registry()
+    return registry
+
+
+def _load_default_registry():
+    global _DEFAULT_LOADED
+
+    with _DEFAULT_LOAD_LOCK:
+        if not _DEFAULT_LOADED:
+            # accessing the registry forces a lazy registry to load its definitions
+            _DEFAULT_REGISTRY.Unit("dimensionless")
+            _DEFAULT_LOADED = True
 
 
 def set_registry(registry: pint.UnitRegistry):
     """Set the Pydantic Pint global registry.
 
+    The unit caches are cleared when the registry is swapped, and the registry generation is incremented.
+    Swapping is thread safe: concurrent validation sees either the previous or the new registry.
+    Annotations keep the registry that was global when they were created.
+
     Args:
         registry: The new global registry.
     """
-    app_registry.set(registry)
+    global _REGISTRY_GENERATION
+
+    with _REGISTRY_SET_LOCK:
+        previous = app_registry.get()
+        _register_reducers(registry)
+        app_registry.set(registry)
+        if previous is not registry and previous not in _NAMED_REGISTRIES.values():
+            # the swapped out registry is no longer pickled by name, nor kept alive by `copyreg`
+            _unregister_reducers(previous)
+        clear_unit_caches()
+        _REGISTRY_GENERATION += 1
+
+
+def registry_generation() -> int:
+    """Get the generation of the Pydantic Pint global registry.
+
+    The generation is incremented every time the registry is set with `set_registry`,
+    e.g. to invalidate caches derived from the global registry.
+
+    Returns:
+        The number of times the global registry has been set.
+    """
+    return _REGISTRY_GENERATION
+
+
+APP_REGISTRY_NAME = "app"
+"""Name of the Pydantic Pint global registry, resolved in the unpickling process."""
+
+# name -> unit registry, for pickling annotations and quantities across processes
+_NAMED_REGISTRIES: dict[str, pint.UnitRegistry] = {}
+# unit registries whose quantities and units are pickled by name
+_REDUCED_REGISTRIES: weakref.WeakSet[pint.UnitRegistry] = weakref.WeakSet()
+
+
+def register_registry(name: str, registry: pint.UnitRegistry):
+    """Register a unit registry by name.
+
+    Annotations, quantities and units of a named registry are pickled with the name of the registry
+    instead of the registry itself, and are reattached to the registry of the same name on unpickling.
+    Register the registry in every process (e.g. at import or in the initializer of a process pool).
+
+    Args:
+        name: The name of the registry.
+        registry: The unit registry.
+    """
+    if name == APP_REGISTRY_NAME:
+        raise ValueError(f"registry name {name!r} is reserved for the global registry")
+
+    _NAMED_REGISTRIES[name] = registry
+    _register_reducers(registry)
+
+
+def lookup_registry(name: str) -> pint.UnitRegistry:
+    """Get a unit registry by name.
+
+    Args:
+        name: The name of the registry; `"app"` for the Pydantic Pint global registry.
+
+    Returns:
+        The unit registry.
+
+    Raises:
+        TypeError: No unit registry is registered with the name.
+    """
+    if name == APP_REGISTRY_NAME:
+        return _global_registry()
+
+    try:
+        return _NAMED_REGISTRIES[name]
+    except KeyError:
+        raise TypeError(f"unknown unit registry: {name!r}") from None
+
+
+def registry_name(registry: pint.UnitRegistry) -> str | None:
+    """Get the name of a unit registry.
+
+    Args:
+        registry: The unit registry.
+
+    Returns:
+        The name the registry is registered with, `"app"` for the Pydantic Pint global registry,
+        or `None` if the registry has no name.
+    """
+    for name, named in _NAMED_REGISTRIES.items():
+        if named is registry:
+            return name
+
+    if registry is _global_registry():
+        return APP_REGISTRY_NAME
+    return None
+
+
+def _register_reducers(registry: pint.UnitRegistry):
+    if registry in _REDUCED_REGISTRIES:
+        return
+
+    # each registry builds its own quantity and unit classes
+    copyreg.pickle(registry.Quantity, _reduce_quantity)
+    copyreg.pickle(registry.Unit, _reduce_unit)
+    _REDUCED_REGISTRIES.add(registry)
+
+
+def _unregister_reducers(registry: pint.UnitRegistry):
+    if registry not in _REDUCED_REGISTRIES:
+        return
+
+    # the quantity and unit classes reference their registry
+    copyreg.dispatch_table.pop(registry.Quantity, None)
+    copyreg.dispatch_table.pop(registry.Unit, None)
+    _REDUCED_REGISTRIES.discard(registry)
+
+
+def _reduce_quantity(quantity: pint.Quantity):
+    name = registry_name(quantity._REGISTRY)
+    if name is None:
+        return quantity.__reduce__()
+    return _unpickle_quantity, (name, quantity.magnitude, tuple(quantity._units.items()))
+
+
+def _reduce_unit(unit: pint.Unit):
+    name = registry_name(unit._REGISTRY)
+    if name is None:
+        return unit.__reduce__()
+    return _unpickle_unit, (name, tuple(unit._units.items()))
+
+
+def _unpickle_quantity(name: str, magnitude: Any, items: tuple) -> pint.Quantity:
+    return lookup_registry(name).Quantity(magnitude, _unpickle_unit(name, items))
+
+
+def _unpickle_unit(name: str, items: tuple) -> pint.Unit:
+    return lookup_registry(name).Unit(pint.util.UnitsContainer(dict(items)))
+
+
+_REGISTRY_READY = threading.Event()
+_REGISTRY_WARM_LOCK = threading.Lock()
+_REGISTRY_LOAD_TIME: float | None = None
+
+
+def warm_registry(
+    units: Iterable[str] = (),
+    *,
+    background: bool = False,
+) -> threading.Thread | None:
+    """Load the Pydantic Pint global registry ahead of the first validation.
+
+    The default registry is lazily loaded, i.e. the unit definitions are parsed on first use.
+    Warming the registry moves this cost to a controlled point, e.g. at import or worker start up.
+    The readiness can be checked with `is_registry_ready` and `wait_registry_ready`.
+
+    !!! note
+
+        When warming in the background, `get_registry` (and creating annotations) waits until the
+        registry is loaded. Do not use `app_registry` directly while the registry is being loaded.
+
+    Args:
+        units:
+            Unit strings to parse and store in the unit cache of the registry.
+        background:
+            Whether or not to load the registry in a background (daemon) thread.
+
+    Returns:
+        The background thread if loading in the background, otherwise `None`.
+    """
+    units = list(units)
+
+    if background:
+        thread = threading.Thread(
+            target=_warm_registry,
+            args=(units,),
+            name="pydantic-pint-warm-registry",
+            daemon=True,
+        )
+        thread.start()
+        return thread
+
+    _warm_registry(units)
+    return None
+
+
+def _warm_registry(units: list[str]):
+    global _REGISTRY_LOAD_TIME
+
+    with _REGISTRY_WARM_LOCK:
+        start = time.perf_counter()
+
+        registry = _global_registry()
+        # accessing the registry forces a lazy registry to load its definitions
+        registry.Unit("dimensionless")
+
+        cache = get_unit_cache(registry)
+        for unit in units:
+            cache.get(unit)
+
+        _REGISTRY_LOAD_TIME = time.perf_counter() - start
+        _REGISTRY_READY.set()
+
+
+def is_registry_ready() -> bool:
+    """Whether or not the Pydantic Pint global registry has been warmed.
+
+    Returns:
+        `True` if `warm_registry` has finished loading the registry.
+    """
+    return _REGISTRY_READY.is_set()
+
+
+def wait_registry_ready(timeout: float | None = None) -> bool:
+    """Wait until the Pydantic Pint global registry has been warmed.
+
+    Args:
+        timeout: The maximum time to wait in seconds; wait forever if `None`.
+
+    Returns:
+        `True` if the registry is ready, `False` if the timeout elapsed.
+    """
+    return _REGISTRY_READY.wait(timeout)
+
+
+def registry_load_time() -> float | None:
+    """Get the time it took `warm_registry` to load the registry.
+
+    Returns:
+        The load time in seconds, or `None` if the registry has not been warmed.
+    """
+    return _REGISTRY_LOAD_TIME
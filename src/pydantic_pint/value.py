@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 from numbers import Number
 
 if sys.version_info >= (3, 13):
@@ -22,9 +23,12 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=None)
 def pydantic_pint_value_schema() -> SchemaSerializer:
     """The schema that can serialize a `pint.Quantity`.
 
+    The serializer is built once, on first use, and shared by all quantities.
+
     Returns:
         The serializer schema for Pydantic.
     """
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from pydantic import ValidationError
+
+from pydantic_pint import PydanticPintQuantity, get_registry
+from pydantic_pint.parallel import validate_quantities_async
+from pydantic_pint.registry import create_registry
+
+
+def test_validate_quantities_async_threads():
+    ureg = get_registry()
+    annotation = PydanticPintQuantity("m")
+    values = [f"{i} km" for i in range(25)]
+
+    async def main():
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            return await validate_quantities_async(
+                annotation, values, executor=executor, chunk_size=4
+            )
+
+    results = asyncio.run(main())
+    assert results == [ureg.Quantity(i * 1000, "m") for i in range(25)]
+
+    # default executor of the event loop
+    results = asyncio.run(validate_quantities_async(annotation, values, chunk_size=7))
+    assert results == [ureg.Quantity(i * 1000, "m") for i in range(25)]
+
+
+def test_validate_quantities_async_processes():
+    ureg = get_registry()
+    annotation = PydanticPintQuantity("m", strict=False)
+    values = ["1 km", {"magnitude": 2.5, "units": "cm"}, 3]
+
+    async def main():
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            return await validate_quantities_async(
+                annotation, values, executor=executor, chunk_size=2
+            )
+
+    results = asyncio.run(main())
+    assert results == [ureg("1000 m"), ureg("0.025 m"), ureg("3 m")]
+    assert all(v._REGISTRY is ureg for v in results)
+
+
+def test_validate_quantities_async_errors():
+    annotation = PydanticPintQuantity("m")
+    values = ["1 m", "2 m", "3 s"]
+
+    with pytest.raises(ValidationError) as exc_info:
+        asyncio.run(validate_quantities_async(annotation, values, chunk_size=2))
+    assert exc_info.value.errors()[0]["loc"] == (2,)
+
+    annotation = PydanticPintQuantity("m", ureg=create_registry())
+    with pytest.raises(TypeError):
+
+        async def main():
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                return await validate_quantities_async(annotation, values, executor=executor)
+
+        asyncio.run(main())
+
+
+def test_validate_quantities_async_process_errors():
+    annotation = PydanticPintQuantity("m")
+    values = ["1 m", "2 m", "3 s", "4 m", "5 m", "6 kg"]
+
+    async def main():
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            return await validate_quantities_async(
+                annotation, values, executor=executor, chunk_size=2
+            )
+
+    with pytest.raises(ValidationError) as exc_info:
+        asyncio.run(main())
+    errors = exc_info.value.errors()
+    assert len(errors) == 1
+    assert errors[0]["loc"] == (2,)
+    assert errors[0]["type"] == "quantity_dimensionality"
+    assert errors[0]["input"] == "3 s"
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import pytest
+from pint import UnitRegistry
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel, ValidationError
+
+from pydantic_pint import PydanticPintQuantity, get_registry
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+def test_quantity_allowed_units():
+    ureg = get_registry()
+
+    class TestModel(BaseModel):
+        value: Annotated[
+            PlainQuantity, PydanticPintQuantity("m", allowed_units=["m", "meter", "km"])
+        ]
+
+    x = TestModel(value="1 km")
+    assert x.value == ureg("1000 m")
+
+    x = TestModel(value={"magnitude": 2, "units": "meter"})
+    assert x.value == ureg("2 m")
+
+    x = TestModel(value=ureg.Quantity(3, "km"))
+    assert x.value == ureg("3000 m")
+
+    with pytest.raises(ValidationError):
+        TestModel(value="1 mm")
+
+    with pytest.raises(ValidationError):
+        TestModel(value={"magnitude": 1, "units": "mm"})
+
+    with pytest.raises(ValidationError):
+        TestModel(value={"magnitude": 1, "units": "meterz"})
+
+    with pytest.raises(ValidationError):
+        TestModel(value="1 km * 2")
+
+    with pytest.raises(ValidationError):
+        TestModel(value=ureg.Quantity(3, "mm"))
+
+
+def test_quantity_allowed_units_preresolved():
+    ureg = get_registry()
+    annotation = PydanticPintQuantity("m", allowed_units=["km", "mi"], strict=False)
+
+    assert set(annotation._conversions) == {ureg.Unit("km"), ureg.Unit("mi")}
+    assert annotation.validate(5) == ureg("5 m")
+
+
+def test_quantity_allowed_units_other_registry():
+    other = UnitRegistry()
+
+    class TestModel(BaseModel):
+        value: Annotated[
+            PlainQuantity, PydanticPintQuantity("m", allowed_units=["m", "km"])
+        ]
+
+    x = TestModel(value=other.Quantity(2, "km"))
+    assert x.value == other.Quantity(2000, "m")
+
+    with pytest.raises(ValidationError) as exc_info:
+        TestModel(value=other.Quantity(2, "cm"))
+    assert exc_info.value.errors()[0]["type"] == "quantity_not_allowed"
+
+
+def test_quantity_allowed_units_json_schema():
+    class TestModel(BaseModel):
+        value: Annotated[
+            PlainQuantity, PydanticPintQuantity("m", allowed_units=["m", "km"])
+        ]
+
+    schema = TestModel.model_json_schema(mode="validation")
+    variants = schema["properties"]["value"]["anyOf"]
+    units = [v["properties"]["units"] for v in variants if v.get("type") == "object"]
+    assert units[0]["enum"] == ["m", "km"]
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import pytest
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel, ValidationError
+
+from pydantic_pint import PydanticPintQuantity, get_registry
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+np = pytest.importorskip("numpy")
+
+
+def test_quantity_array_magnitudes_dict():
+    ureg = get_registry()
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m", array=True)]
+
+    x = TestModel(value={"magnitude": [1, 2, 3], "units": "km"})
+    assert isinstance(x.value.m, np.ndarray)
+    assert x.value.u == ureg.Unit("m")
+    assert x.value.m.tolist() == [1000, 2000, 3000]
+
+    x = TestModel.model_validate_json(
+        '{"value": {"magnitude": [[1.5, 2.5], [3.5, 4.5]], "units": "m"}}'
+    )
+    assert x.value.m.shape == (2, 2)
+    assert x.value.m.tolist() == [[1.5, 2.5], [3.5, 4.5]]
+
+    x = TestModel(value={"magnitude": np.arange(3), "units": "mm"})
+    assert x.value.m.tolist() == [0, 0.001, 0.002]
+
+
+def test_quantity_array_magnitudes_quantity():
+    ureg = get_registry()
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("[length]", array=True)]
+
+    x = TestModel(value=ureg.Quantity(np.array([1.0, 2.0]), "km"))
+    assert x.value.u == ureg.Unit("km")
+    assert x.value.m.tolist() == [1.0, 2.0]
+
+
+def test_quantity_array_magnitudes_nonstrict():
+    ureg = get_registry()
+
+    class TestModel(BaseModel):
+        value: Annotated[
+            PlainQuantity, PydanticPintQuantity("m", array=True, strict=False)
+        ]
+
+    x = TestModel(value=[1, 2, 3])
+    assert x.value.u == ureg.Unit("m")
+    assert x.value.m.tolist() == [1, 2, 3]
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m", array=True)]
+
+    with pytest.raises(ValidationError):
+        TestModel(value=[1, 2, 3])
+
+
+def test_quantity_array_magnitudes_dtype_and_shape():
+    class TestModel(BaseModel):
+        value: Annotated[
+            PlainQuantity,
+            PydanticPintQuantity("m", array=True, dtype="float32", shape=(None, 2)),
+        ]
+
+    x = TestModel(value={"magnitude": [[1, 2], [3, 4], [5, 6]], "units": "m"})
+    assert x.value.m.dtype == np.float32
+    assert x.value.m.shape == (3, 2)
+
+    with pytest.raises(ValidationError):
+        TestModel(value={"magnitude": [1, 2], "units": "m"})
+
+    with pytest.raises(ValidationError):
+        TestModel(value={"magnitude": [["a", "b"]], "units": "m"})
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m", array=True, dtype="int64")]
+
+    with pytest.raises(ValidationError):
+        TestModel(value={"magnitude": [1.5, 2.5], "units": "m"})
+
+
+def test_quantity_array_magnitudes_serialization():
+    class TestModel(BaseModel):
+        value: Annotated[
+            PlainQuantity, PydanticPintQuantity("m", array=True, ser_mode="dict")
+        ]
+
+    x = TestModel(value={"magnitude": [1, 2, 3], "units": "m"})
+    assert x.model_dump_json() == '{"value":{"magnitude":[1,2,3],"units":"meter"}}'
+    assert TestModel.model_validate_json(x.model_dump_json()).value.m.tolist() == [1, 2, 3]
+
+    class TestModel(BaseModel):
+        value: Annotated[
+            PlainQuantity, PydanticPintQuantity("m", array=True, ser_mode="number")
+        ]
+
+    x = TestModel(value={"magnitude": [1.5, 2.5], "units": "m"})
+    assert x.model_dump(mode="json") == {"value": [1.5, 2.5]}
+
+    schema = TestModel.model_json_schema(mode="serialization")
+    assert isinstance(schema, dict)
+
+
+def test_quantity_array_magnitudes_scalar():
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m", array=True)]
+
+    for value in ["3 m", {"magnitude": 3, "units": "m"}, get_registry().Quantity(3, "m")]:
+        with pytest.raises(ValidationError, match="at least one dimension"):
+            TestModel(value=value)
+
+
+def test_quantity_array_magnitudes_serialization_default():
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("degC", array=True)]
+
+    x = TestModel(value={"magnitude": [0, 100], "units": "degF"})
+    data = x.model_dump_json()
+    assert data == (
+        '{"value":{"magnitude":[-17.777777777777743,37.777777777777814],'
+        '"units":"degree_Celsius"}}'
+    )
+    assert np.allclose(TestModel.model_validate_json(data).value.m, x.value.m)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from pint import UnitRegistry
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel
+
+from pydantic_pint import PydanticPintQuantity, get_registry
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+def test_quantity_canonical_units_identity():
+    ureg = get_registry()
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m")]
+
+    value = ureg.Quantity(1.5, "m")
+    x = TestModel(value=value)
+    assert x.value is value
+
+    value = ureg.Quantity(1.5, "km")
+    x = TestModel(value=value)
+    assert x.value is not value
+    assert x.value == value
+
+
+def test_quantity_canonical_units_other_registry():
+    other = UnitRegistry()
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m")]
+
+    value = other.Quantity(1.5, "km")
+    x = TestModel(value=value)
+    assert x.value._REGISTRY is other
+    assert x.value.magnitude == 1500
+    assert str(x.value.units) == "meter"
+
+    value = other.Quantity(1.5, "m")
+    assert TestModel(value=value).value.magnitude == 1.5
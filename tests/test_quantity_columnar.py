@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel, ValidationError
+
+from pydantic_pint import PydanticPintQuantity, get_registry
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+def test_quantity_columnar_serialize():
+    ureg = get_registry()
+
+    class TestModel(BaseModel):
+        values: Annotated[List[PlainQuantity], PydanticPintQuantity("m", ser_mode="columnar")]
+
+    x = TestModel(values=["1 m", "2 km", {"magnitude": 3.5, "units": "m"}])
+    assert x.model_dump(mode="json") == {
+        "values": {"units": "meter", "magnitudes": [1, 2000, 3.5]},
+    }
+
+    annotation = PydanticPintQuantity("m", ser_mode="columnar")
+    assert annotation.serialize_many(x.values) == {
+        "units": ureg.Unit("m"),
+        "magnitudes": [1, 2000, 3.5],
+    }
+
+    y = TestModel.model_validate_json(x.model_dump_json())
+    assert y.values == x.values
+
+
+def test_quantity_columnar_validate():
+    ureg = get_registry()
+
+    class TestModel(BaseModel):
+        values: Annotated[List[PlainQuantity], PydanticPintQuantity("m", ser_mode="columnar")]
+
+    x = TestModel(values={"units": "km", "magnitudes": [1, 2.5]})
+    assert x.values == [ureg("1000 m"), ureg("2500 m")]
+
+    x = TestModel(values={"units": "m", "magnitudes": []})
+    assert x.values == []
+
+    with pytest.raises(ValidationError):
+        TestModel(values={"units": "s", "magnitudes": [1, 2]})
+
+    with pytest.raises(ValidationError):
+        TestModel(values={"units": "meterz", "magnitudes": [1, 2]})
+
+    with pytest.raises(ValidationError):
+        TestModel(values={"magnitudes": [1, 2]})
+
+
+def test_quantity_columnar_mixed_units():
+    class TestModel(BaseModel):
+        values: Annotated[
+            List[PlainQuantity],
+            PydanticPintQuantity("[length]", ser_mode="columnar"),
+        ]
+
+    x = TestModel(values=["1 m", "2 km"])
+    assert x.model_dump(mode="json") == {
+        "values": [
+            {"magnitude": 1, "units": "meter"},
+            {"magnitude": 2, "units": "kilometer"},
+        ],
+    }
+
+    x = TestModel(values=["1 m", "2 m"])
+    assert x.model_dump(mode="json") == {
+        "values": {"units": "meter", "magnitudes": [1, 2]},
+    }
+
+
+def test_quantity_columnar_per_element():
+    # each quantity is annotated on its own, the list is not serialized to columns
+    class TestModel(BaseModel):
+        values: List[
+            Annotated[PlainQuantity, PydanticPintQuantity("m", ser_mode="columnar")]
+        ]
+
+    x = TestModel(values=["1 m", "2 km"])
+    assert x.model_dump(mode="json") == {
+        "values": [
+            {"magnitude": 1, "units": "meter"},
+            {"magnitude": 2000.0, "units": "meter"},
+        ]
+    }
+
+
+def test_quantity_columnar_array():
+    np = pytest.importorskip("numpy")
+    ureg = get_registry()
+
+    class TestModel(BaseModel):
+        value: Annotated[
+            PlainQuantity,
+            PydanticPintQuantity("m", ser_mode="columnar", array=True),
+        ]
+
+    x = TestModel(value={"units": "km", "magnitudes": [1, 2]})
+    assert isinstance(x.value.magnitude, np.ndarray)
+    assert x.value.units == ureg.Unit("m")
+    assert x.value.magnitude.tolist() == [1000, 2000]
+    assert x.model_dump(mode="json") == {
+        "value": {"units": "meter", "magnitudes": [1000, 2000]},
+    }
+
+    annotation = PydanticPintQuantity("m")
+    v = annotation.validate_many({"units": "km", "magnitudes": [1, 2]}, as_array=True)
+    assert isinstance(v.magnitude, np.ndarray)
+    assert v.magnitude.tolist() == [1000, 2000]
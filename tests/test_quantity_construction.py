@@ -94,3 +94,118 @@ def test_quantity_construction_dict_strict():
 
     with pytest.raises(ValidationError):
         TestModel(value={"magnitude": 1})
+
+
+def test_quantity_construction_dict_numeric_magnitude():
+    ureg = get_registry()
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m")]
+
+    x = TestModel.model_validate_json('{"value": {"magnitude": 1.5, "units": "km"}}')
+    assert x.value.m == 1500
+    assert x.value.u == ureg.Unit("m")
+
+    x = TestModel.model_validate_json('{"value": {"magnitude": 2, "units": "m"}}')
+    assert x.value.m == 2
+    assert isinstance(x.value.m, int)
+
+    x = TestModel(value={"magnitude": "1.5", "units": "km"})
+    assert x.value.m == 1500
+    assert x.value.u == ureg.Unit("m")
+
+    # booleans are not magnitudes
+    with pytest.raises(ValidationError):
+        TestModel.model_validate_json('{"value": {"magnitude": true, "units": "km"}}')
+    with pytest.raises(ValidationError):
+        TestModel(value={"magnitude": False, "units": "km"})
+
+
+def test_quantity_construction_dict_units_expression():
+    ureg = get_registry()
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m/s")]
+
+    x = TestModel(value={"magnitude": 3, "units": "m / (2 s)"})
+    assert x.value.m == 1.5
+    assert x.value.u == ureg.Unit("m/s")
+
+    with pytest.raises(ValidationError):
+        TestModel(value={"magnitude": 3, "units": "meterz"})
+
+
+def test_quantity_construction_str_special_numbers():
+    ureg = get_registry()
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m", strict=False)]
+
+    x = TestModel(value="-inf km")
+    assert x.value.m == float("-inf")
+    assert x.value.u == ureg.Unit("m")
+
+    x = TestModel(value="1e3")
+    assert x.value.m == 1000
+    assert x.value.u == ureg.Unit("m")
+
+    x = TestModel(value="nanometer")
+    assert x.value.m == 1e-9
+    assert x.value.u == ureg.Unit("m")
+
+
+def test_quantity_construction_str_expression():
+    ureg = get_registry()
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m/s")]
+
+    x = TestModel(value="3 m / (2 s)")
+    assert x.value.m == 1.5
+    assert x.value.u == ureg.Unit("m/s")
+
+    with pytest.raises(ValidationError):
+        TestModel(value="3 m / (2 meterz)")
+
+
+def test_quantity_construction_number_not_coerced():
+    ureg = get_registry()
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m", strict=False)]
+
+    x = TestModel(value=2)
+    assert isinstance(x.value.m, int)
+    assert x.value == ureg("2m")
+
+    x = TestModel.model_validate_json('{"value": 2.5}')
+    assert isinstance(x.value.m, float)
+    assert x.value == ureg("2.5m")
+
+    with pytest.raises(ValidationError):
+        TestModel(value=True)
+
+
+@pytest.mark.parametrize(
+    "annotation",
+    [
+        PydanticPintQuantity("m", strict=True),
+        PydanticPintQuantity("[length]", strict=False),
+    ],
+)
+def test_quantity_construction_number_rejected(annotation):
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, annotation]
+
+    # numbers are not validated natively by fields requiring units
+    schema = TestModel.__pydantic_core_schema__["schema"]["fields"]["value"]["schema"]
+    choices = schema["python_schema"]["schema"]["choices"]
+    assert not any(choice["type"] in ("int", "float") for choice in choices)
+
+    for validate in (
+        lambda: TestModel(value=2),
+        lambda: TestModel.model_validate_json('{"value": 2.5}'),
+    ):
+        with pytest.raises(ValidationError) as exc_info:
+            validate()
+        assert exc_info.value.errors()[0]["type"] == "quantity_strict"
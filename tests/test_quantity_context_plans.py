@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import pint
+import pytest
+from pint.facets.context.objects import ContextChain
+
+from pydantic_pint import PydanticPintQuantity
+from pydantic_pint.registry import create_registry
+
+
+@pytest.fixture(scope="module")
+def ureg():
+    return create_registry()
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["500 THz", "500 um", "2 eV", "3 1/cm", "1.5 nm"],
+)
+def test_quantity_context_plans(ureg, value):
+    annotation = PydanticPintQuantity("nm", ureg=ureg, ureg_contexts=["sp"])
+
+    expected = ureg(value).to("nm", "sp")
+    for _ in range(2):
+        v = annotation.validate(value)
+        assert v.units == expected.units
+        assert v.magnitude == pytest.approx(expected.magnitude)
+
+    units = ureg(value).units
+    assert units == annotation.units or units in annotation._context_paths
+
+
+def test_quantity_context_plans_redefinitions(ureg):
+    ctx = pint.Context("test-redefine")
+    ctx.redefine("pound = 0.5 kg")
+    ureg.add_context(ctx)
+
+    annotation = PydanticPintQuantity("kg", ureg=ureg, ureg_contexts=["test-redefine"])
+    assert annotation.validate("2 lb") == ureg.Quantity(1.0, "kg")
+    assert annotation._context_paths == {}
+
+
+def test_quantity_context_plans_active_contexts(ureg):
+    annotation = PydanticPintQuantity("nm", ureg=ureg, ureg_contexts=["sp"])
+
+    with ureg.context("sp"):
+        v = annotation.validate("500 THz")
+    assert v.magnitude == pytest.approx(ureg("500 THz").to("nm", "sp").magnitude)
+
+
+def test_quantity_context_plans_errors(ureg):
+    annotation = PydanticPintQuantity("nm", ureg=ureg, ureg_contexts=["sp"])
+    with pytest.raises(ValueError):
+        annotation.validate("1 kg")
+
+    annotation = PydanticPintQuantity("nm", ureg=ureg, ureg_contexts=["test-missing"])
+    with pytest.raises(TypeError):
+        annotation.validate("1 THz")
+
+
+@pytest.mark.parametrize("missing", ["insert_contexts", "graph", "transform"])
+def test_quantity_context_plans_missing_internals(monkeypatch, missing):
+    # the context chain of Pint is internal, and may differ in other versions of Pint
+    class _ContextChain(ContextChain):
+        def __getattribute__(self, name):
+            if name == missing:
+                raise AttributeError(name)
+            return super().__getattribute__(name)
+
+    monkeypatch.setattr("pydantic_pint.quantity.ContextChain", _ContextChain)
+
+    ureg = create_registry()
+    annotation = PydanticPintQuantity("nm", ureg=ureg, ureg_contexts=["sp"])
+    for value in ["500 THz", "1.5 um", "500 THz"]:
+        expected = ureg(value).to("nm", "sp")
+        v = annotation.validate(value)
+        assert v.units == expected.units
+        assert v.magnitude == pytest.approx(expected.magnitude)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import pytest
+from pint import UnitRegistry
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel, ValidationError
+
+from pydantic_pint import PydanticPintQuantity
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+def test_quantity_conversion_memo_multiplicative_units():
+    ureg = UnitRegistry()
+    annotation = PydanticPintQuantity("m", ureg=ureg)
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, annotation]
+
+    for magnitude in (1, 2.5, -3):
+        x = TestModel(value=ureg.Quantity(magnitude, "km"))
+        assert x.value.u == ureg.Unit("m")
+        assert x.value.m == ureg.Quantity(magnitude, "km").to("m").m
+
+    assert annotation._conversions == {ureg.Unit("km"): (1000.0, None)}
+
+
+def test_quantity_conversion_memo_nonmult_units():
+    ureg = UnitRegistry()
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("degC", ureg=ureg)]
+
+    for magnitude in (0.0, 32.0, 212.0, -40.0):
+        x = TestModel(value=ureg.Quantity(magnitude, "degF"))
+        assert x.value.u == ureg.Unit("degC")
+        assert x.value.m == pytest.approx(ureg.Quantity(magnitude, "degF").to("degC").m)
+
+    x = TestModel(value=ureg.Quantity(300.0, "K"))
+    assert x.value.m == ureg.Quantity(300.0, "K").to("degC").m
+
+
+def test_quantity_conversion_memo_incompatible_units():
+    ureg = UnitRegistry()
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m", ureg=ureg)]
+
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            TestModel(value="1s")
+
+
+
+@pytest.mark.parametrize("units, source_units", [("dBW", "dBm"), ("dBm", "dBu")])
+def test_quantity_conversion_memo_logarithmic_units(units, source_units):
+    ureg = UnitRegistry()
+    if units not in ureg:
+        pytest.skip(f"'{units}' is not defined with this version of Pint")
+    annotation = PydanticPintQuantity(units, ureg=ureg)
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, annotation]
+        ratio: Annotated[PlainQuantity, PydanticPintQuantity("dimensionless", ureg=ureg)]
+
+    for _ in range(2):
+        x = TestModel(value=ureg.Quantity(20, source_units), ratio="10 dB")
+        assert x.value.u == ureg.Unit(units)
+        assert x.value.m == pytest.approx(-10)
+        assert x.ratio.m == pytest.approx(10)
+
+    assert annotation._conversions == {ureg.Unit(source_units): None}
+    values = annotation.validate_many([f"20 {source_units}", f"30 {source_units}"])
+    assert [v.m for v in values] == pytest.approx([-10, 0], abs=1e-9)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import Any, List
+
+import pytest
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel, ValidationError
+from pydantic_core import PydanticCustomError
+
+from pydantic_pint import PydanticPintQuantity, get_registry
+from pydantic_pint.errors import (
+    QUANTITY_DIMENSIONALITY,
+    QUANTITY_EXACT,
+    QUANTITY_MISSING_KEYS,
+    QUANTITY_NOT_ALLOWED,
+    QUANTITY_PARSING,
+    QUANTITY_STRICT,
+    QUANTITY_UNKNOWN_UNIT,
+)
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+def _error(annotation: PydanticPintQuantity, value: Any) -> dict[str, Any]:
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, annotation]
+
+    with pytest.raises(ValidationError) as exc_info:
+        TestModel(value=value)
+
+    errors = exc_info.value.errors()
+    assert len(errors) == 1
+    return errors[0]
+
+
+@pytest.mark.parametrize(
+    "annotation, value, error_type",
+    [
+        (PydanticPintQuantity("m"), "1 meterz", QUANTITY_UNKNOWN_UNIT),
+        (PydanticPintQuantity("m"), {"magnitude": 1, "units": "meterz"}, QUANTITY_UNKNOWN_UNIT),
+        (PydanticPintQuantity("m"), "1 s", QUANTITY_DIMENSIONALITY),
+        (PydanticPintQuantity("[length]"), "1 s", QUANTITY_DIMENSIONALITY),
+        (PydanticPintQuantity("m"), 1, QUANTITY_STRICT),
+        (PydanticPintQuantity("[length]", strict=False), 1, QUANTITY_STRICT),
+        (PydanticPintQuantity("m", exact=True), "1 km", QUANTITY_EXACT),
+        (PydanticPintQuantity("[length]", exact=True), "1 s", QUANTITY_EXACT),
+        (PydanticPintQuantity("m", allowed_units=["m"]), "1 km", QUANTITY_NOT_ALLOWED),
+        (PydanticPintQuantity("degC"), "1 degC * 2 degC", QUANTITY_PARSING),
+    ],
+)
+def test_quantity_error_types(annotation, value, error_type):
+    assert _error(annotation, value)["type"] == error_type
+
+
+def test_quantity_error_context():
+    error = _error(PydanticPintQuantity("m"), "1 meterz")
+    assert error["ctx"] == {"units": "meterz"}
+    assert error["msg"] == "'meterz' is not defined in the unit registry"
+
+    error = _error(PydanticPintQuantity("m"), "1 s")
+    assert error["ctx"]["from_units"] == "second"
+    assert error["ctx"]["to_units"] == "meter"
+    assert error["msg"] == "cannot convert from 'second' ([time]) to 'meter' ([length])"
+
+    error = _error(PydanticPintQuantity("m", exact=True), "1 km")
+    assert error["ctx"] == {"units": get_registry().Unit("m")}
+    assert error["msg"] == "must specify exact units: 'meter'"
+
+
+def test_quantity_error_is_value_error():
+    annotation = PydanticPintQuantity("m")
+
+    with pytest.raises(ValueError, match="cannot convert") as exc_info:
+        annotation.validate("1 s")
+    assert isinstance(exc_info.value, PydanticCustomError)
+    assert exc_info.value.type == QUANTITY_DIMENSIONALITY
+
+    with pytest.raises(PydanticCustomError) as exc_info:
+        annotation.validate({"units": "m"})
+    assert exc_info.value.type == QUANTITY_MISSING_KEYS
+
+
+def test_quantity_error_types_lists():
+    annotation = PydanticPintQuantity("m")
+
+    with pytest.raises(ValidationError) as exc_info:
+        annotation.validate_many(["1 m", "1 meterz"])
+    error = exc_info.value.errors()[0]
+    assert error["type"] == QUANTITY_UNKNOWN_UNIT
+    assert error["loc"] == (1,)
+    assert error["ctx"] == {"units": "meterz"}
+    assert error["msg"] == "'meterz' is not defined in the unit registry"
+
+    class TestModel(BaseModel):
+        value: Annotated[List[PlainQuantity], annotation]
+
+    with pytest.raises(ValidationError) as exc_info:
+        TestModel(value=["1 m", "2 m", "1 s"])
+    error = exc_info.value.errors()[0]
+    assert error["type"] == QUANTITY_DIMENSIONALITY
+    assert error["loc"] == ("value", 2)
+    assert error["input"] == "1 s"
+    assert "2" not in error["msg"]
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import gc
+import weakref
+
+from pint import UnitRegistry
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel
+
+from pydantic_pint import PydanticPintQuantity, get_registry
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+def test_quantity_interning_same_arguments():
+    ureg = UnitRegistry()
+
+    x = PydanticPintQuantity("degC", ureg=ureg, strict=False)
+    y = PydanticPintQuantity("degC", ureg=ureg, strict=False)
+    assert x is y
+
+    x = PydanticPintQuantity({"[length]": 1}, ureg=ureg)
+    y = PydanticPintQuantity({"[length]": 1}, ureg=ureg)
+    assert x is y
+    assert x.restriction == "dimensions"
+
+
+def test_quantity_interning_different_arguments():
+    ureg = UnitRegistry()
+
+    x = PydanticPintQuantity("degC", ureg=ureg)
+    assert x is not PydanticPintQuantity("degF", ureg=ureg)
+    assert x is not PydanticPintQuantity("degC", ureg=ureg, strict=False)
+    assert x is not PydanticPintQuantity("degC", ureg=ureg, ser_mode="dict")
+    assert x is not PydanticPintQuantity("degC", ureg=UnitRegistry())
+    assert x is not PydanticPintQuantity("degC", ureg=ureg, ureg_contexts=["sp"])
+    assert x is not PydanticPintQuantity("degC")
+
+
+def test_quantity_interning_contexts_iterator():
+    ureg = UnitRegistry()
+
+    x = PydanticPintQuantity("nm", ureg=ureg, ureg_contexts=iter(["sp"]))
+    assert list(x.ureg_contexts) == ["sp"]
+
+
+def test_quantity_interning_core_schema():
+    ureg = get_registry()
+
+    class TestModelA(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m", ser_mode="dict")]
+
+    class TestModelB(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m", ser_mode="dict")]
+
+    annotation = PydanticPintQuantity("m", ser_mode="dict")
+    assert len(annotation._core_schemas) == 1
+
+    assert TestModelA(value="1km").value == ureg("1000m")
+    assert TestModelB(value="1km").value == ureg("1000m")
+    assert TestModelB(value="1km").model_dump(mode="json") == {
+        "value": {"magnitude": 1000.0, "units": "meter"}
+    }
+
+
+def test_quantity_interning_registry_collected():
+    ureg = UnitRegistry()
+    x = PydanticPintQuantity("km", ureg=ureg)
+    y = PydanticPintQuantity("[length]", ureg=ureg)
+    assert PydanticPintQuantity("km", ureg=ureg, strict=False).units == x.units
+
+    # the resolved units do not keep the unit registry alive
+    ref = weakref.ref(ureg)
+    del ureg, x, y
+    gc.collect()
+    assert ref() is None
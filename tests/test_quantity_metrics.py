@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel, ValidationError
+
+from pydantic_pint import PydanticPintQuantity
+from pydantic_pint.metrics import collect_metrics, reset_metrics
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+def test_quantity_metrics_off():
+    annotation = PydanticPintQuantity("m")
+    assert annotation.metrics is None
+    assert "validate" not in vars(annotation)
+    assert type(annotation._conversions) is dict
+
+
+def test_quantity_metrics():
+    class TestModel(BaseModel):
+        value: Annotated[
+            PlainQuantity, PydanticPintQuantity("m", metrics="test-metrics")
+        ]
+        exact: Annotated[
+            PlainQuantity, PydanticPintQuantity("m", exact=True, metrics="test-exact")
+        ]
+
+    x = TestModel(value="1 km", exact="1 m")
+    TestModel(value="2 km", exact="1 m")
+    TestModel(value="2 m", exact="1 m")
+
+    for value, exact in [
+        ("1", "1 m"),
+        ("1 s", "1 m"),
+        ("1 foo", "1 m"),
+        ("1 m", "1 km"),
+    ]:
+        with pytest.raises(ValidationError):
+            TestModel(value=value, exact=exact)
+
+    x.model_dump(mode="json")
+
+    metrics = {m.name: m for m in collect_metrics()}
+    snapshot = metrics["test-metrics"]
+    assert snapshot.target == "meter"
+    assert snapshot.validations == 7
+    assert snapshot.validation_time > 0
+    assert snapshot.serializations == 1
+    assert snapshot.serialization_time > 0
+    assert snapshot.conversion_cache_hits == 1
+    assert snapshot.failures == {
+        "strict": 1,
+        "exact": 0,
+        "dimensionality": 1,
+        "unknown_unit": 1,
+        "other": 0,
+    }
+    assert metrics["test-exact"].failures["exact"] == 1
+
+    reset_metrics()
+    snapshot = {m.name: m for m in collect_metrics()}["test-metrics"]
+    assert snapshot.validations == 0
+    assert snapshot.failures["strict"] == 0
+
+
+def test_quantity_metrics_lists():
+    annotation = PydanticPintQuantity("m", ser_mode="columnar", metrics=True)
+
+    class TestModel(BaseModel):
+        values: Annotated[List[PlainQuantity], annotation]
+
+    x = TestModel(values=["1 m", "2 km", "3 km"])
+    TestModel(values={"units": "km", "magnitudes": [1, 2]})
+    x.model_dump(mode="json")
+
+    snapshot = annotation.metrics.snapshot()
+    assert snapshot.name is None
+    assert snapshot.validations == 5
+    assert snapshot.serializations == 3
+
+
+def test_quantity_metrics_not_shared():
+    first = PydanticPintQuantity("m", metrics=True)
+    second = PydanticPintQuantity("m", metrics=True)
+    assert first is not second
+    assert first.metrics is not second.metrics
+
+    class TestModel(BaseModel):
+        a: Annotated[PlainQuantity, first]
+        b: Annotated[PlainQuantity, second]
+
+    TestModel(a="1 m", b="1 m")
+    TestModel(a="2 m", b="2 m")
+    with pytest.raises(ValidationError):
+        TestModel(a="1 m", b="1 s")
+
+    assert first.metrics.snapshot().validations == 3
+    assert second.metrics.snapshot().validations == 3
+    assert second.metrics.snapshot().failures["dimensionality"] == 1
+    assert first.metrics.snapshot().failures["dimensionality"] == 0
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import copyreg
+import gc
+import multiprocessing
+import pickle
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from pint import UnitRegistry
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel
+
+from pydantic_pint import PydanticPintQuantity, get_registry, set_registry
+from pydantic_pint.registry import (
+    create_registry,
+    lookup_registry,
+    register_registry,
+    registry_name,
+)
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+class PickleModel(BaseModel):
+    value: Annotated[PlainQuantity, PydanticPintQuantity("m")]
+
+
+def test_quantity_pickle_annotation():
+    annotation = PydanticPintQuantity("km", strict=False, ser_mode="dict")
+
+    assert registry_name(annotation.ureg) == "app"
+    assert pickle.loads(pickle.dumps(annotation)) is annotation
+
+
+def test_quantity_pickle_quantity():
+    ureg = get_registry()
+
+    x = PickleModel(value="1 km")
+    y = pickle.loads(pickle.dumps(x))
+    assert y.value == ureg("1000 m")
+    assert y.value._REGISTRY is ureg
+
+    unit = pickle.loads(pickle.dumps(ureg.Unit("km")))
+    assert unit == ureg.Unit("km")
+    assert unit._REGISTRY is ureg
+
+
+def test_quantity_pickle_named_registry():
+    ureg = create_registry(["widget = [widget]"])
+    register_registry("test-widgets", ureg)
+    assert lookup_registry("test-widgets") is ureg
+    assert registry_name(ureg) == "test-widgets"
+
+    annotation = PydanticPintQuantity("widget", ureg=ureg)
+    assert pickle.loads(pickle.dumps(annotation)) is annotation
+
+    v = pickle.loads(pickle.dumps(annotation.validate("2 widget")))
+    assert v._REGISTRY is ureg
+    assert v == ureg.Quantity(2, "widget")
+
+    with pytest.raises(ValueError):
+        register_registry("app", ureg)
+
+
+def test_quantity_pickle_unnamed_registry():
+    annotation = PydanticPintQuantity("m", ureg=create_registry())
+    with pytest.raises(TypeError):
+        pickle.dumps(annotation)
+
+    with pytest.raises(TypeError):
+        lookup_registry("test-unknown")
+
+
+def test_quantity_pickle_registry_swapped_out():
+    ureg = get_registry()
+    other = UnitRegistry()
+
+    set_registry(other)
+    try:
+        quantity = PydanticPintQuantity("m").validate("1 km")
+        assert copyreg.dispatch_table[other.Quantity] is not None
+        assert pickle.loads(pickle.dumps(quantity))._REGISTRY is other
+    finally:
+        set_registry(ureg)
+
+    # the reducers are dropped, and no longer keep the registry alive
+    assert other.Quantity not in copyreg.dispatch_table
+    assert other.Unit not in copyreg.dispatch_table
+
+    ref = weakref.ref(other)
+    del other, quantity
+    gc.collect()
+    assert ref() is None
+
+
+def _validate(annotation, value):
+    return annotation.validate(value)
+
+
+def test_quantity_pickle_spawn():
+    ureg = get_registry()
+    annotation = PydanticPintQuantity("m")
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        v = executor.submit(_validate, annotation, ureg.Quantity(2, "km")).result()
+
+    assert v == ureg("2000 m")
+    assert v._REGISTRY is ureg
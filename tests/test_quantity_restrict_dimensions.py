@@ -132,3 +132,64 @@ def test_quantity_restrict_dimensions_with_no_default_units_defined():
     assert x.value.m == 1
     assert x.value.u == ureg.Unit("S/m")
     assert x.value == ureg("1 S/m")
+
+
+def test_quantity_restrict_dimensions_with_custom_transformations_context_switch():
+    ureg = UnitRegistry()
+    ctx = Context()
+    ctx.add_transformation(
+        "[length]",
+        "[time]",
+        lambda ureg, x: x / (100 * ureg.miles) * (1.5 * ureg.hours),
+    )
+    ctx.add_transformation(
+        "[time]",
+        "[length]",
+        lambda ureg, x: x / (1.5 * ureg.hours) * (100 * ureg.miles),
+    )
+
+    annotation = PydanticPintQuantity("[length]", exact=False, ureg=ureg)
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, annotation]
+
+    with pytest.raises(ValidationError):
+        TestModel(value="1.5hr")
+
+    with ureg.context(ctx):
+        x = TestModel(value="1.5hr")
+        assert x.value == ureg("1.5hr")
+        x = TestModel(value="3hr")
+        assert x.value == ureg("3hr")
+
+    # fails when outside context block
+    with pytest.raises(ValidationError):
+        TestModel(value="1.5hr")
+
+    # repeated source units are decided by the index
+    TestModel(value="2 km")
+    assert annotation._dimension_index == {
+        ureg.Unit("hr"): False,
+        ureg.Unit("km"): True,
+    }
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_quantity_restrict_dimensions_other_registry(exact):
+    other = UnitRegistry()
+    other.define("widget = 1 s")
+    annotation = PydanticPintQuantity("[length]", ureg=UnitRegistry(), exact=exact)
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, annotation]
+
+    for _ in range(2):
+        x = TestModel(value=other.Quantity(1, "m"))
+        assert x.value == other.Quantity(1, "m")
+
+        # dimensions are resolved in the registry of the quantity
+        with pytest.raises(ValidationError) as exc_info:
+            TestModel(value=other.Quantity(1, "widget"))
+        assert exc_info.value.errors()[0]["type"] in ("quantity_dimensionality", "quantity_exact")
+
+    assert annotation._dimension_index == {}
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import pytest
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel
+
+from pydantic_pint import PydanticPintQuantity
+from pydantic_pint.registry import create_registry
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+@pytest.fixture(scope="module")
+def ureg():
+    return create_registry()
+
+
+@pytest.mark.parametrize("default_format", ["", "~", "D", "~P", "P", "~L", "H"])
+@pytest.mark.parametrize(
+    "magnitude, units",
+    [
+        (1.5, "m/s"),
+        (1e20, "kg"),
+        (3, "degC"),
+        (2.5, ""),
+        (-0.1, "m**2"),
+        (1 / 3, "1/s"),
+    ],
+)
+def test_quantity_serialize_matches_pint(ureg, default_format, magnitude, units):
+    formatter = getattr(ureg, "formatter", None)
+    if formatter is not None:
+        formatter.default_format = default_format
+    else:
+        # pint < 0.24
+        ureg.default_format = default_format
+    annotation = PydanticPintQuantity("", ureg=ureg, restriction="dimensions")
+
+    v = ureg.Quantity(magnitude, units)
+    for _ in range(2):
+        assert annotation.serialize(v, to_json=True) == f"{v}"
+
+
+def test_quantity_serialize_float_format():
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("km", float_format=".3f")]
+        unit_dict: Annotated[
+            PlainQuantity,
+            PydanticPintQuantity("km", ser_mode="dict", float_format=".3f"),
+        ]
+
+    x = TestModel(value="1234.5678 m", unit_dict="1 km")
+    assert x.model_dump(mode="json") == {
+        "value": "1.235 kilometer",
+        "unit_dict": {"magnitude": 1, "units": "kilometer"},
+    }
+
+
+
+@pytest.mark.parametrize(
+    "ser_mode, expected",
+    [
+        (None, "1.2 kilometer"),
+        ("str", "1.2 kilometer"),
+        ("dict", {"magnitude": 1.25, "units": "kilometer"}),
+    ],
+)
+def test_quantity_serialize_other_registry(ser_mode, expected):
+    ureg = create_registry()
+    other = create_registry()
+
+    class TestModel(BaseModel):
+        value: Annotated[
+            PlainQuantity,
+            PydanticPintQuantity("km", ureg=ureg, ser_mode=ser_mode, float_format=".1f"),
+        ]
+
+    x = TestModel(value=ureg.Quantity(1.25, "km"))
+    y = TestModel.model_construct(value=other.Quantity(1.25, "km"))
+    for _ in range(2):
+        assert x.model_dump(mode="json") == {"value": expected}
+        assert y.model_dump(mode="json") == {"value": expected}
+        assert y.model_dump_json() == x.model_dump_json()
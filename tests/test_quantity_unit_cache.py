@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import gc
+import weakref
+
+import pytest
+from pint import UndefinedUnitError, UnitRegistry
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel, ValidationError
+
+from pydantic_pint import PydanticPintQuantity, get_registry, set_registry
+from pydantic_pint.cache import UnitCache, clear_unit_caches, get_unit_cache
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+def test_quantity_unit_cache_hits():
+    ureg = UnitRegistry()
+    cache = get_unit_cache(ureg)
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m", ureg=ureg)]
+
+    x = TestModel(value="1 km")
+    assert x.value == ureg("1000m")
+    assert cache.info().misses == 1
+    assert cache.info().hits == 0
+
+    x = TestModel(value="2.5 km")
+    assert x.value == ureg("2500m")
+    assert cache.info().misses == 1
+    assert cache.info().hits == 1
+
+    x = TestModel(value="3mm")
+    assert x.value == ureg("0.003m")
+    assert cache.info().misses == 2
+    assert cache.info().currsize == 2
+
+
+def test_quantity_unit_cache_expression_fallback():
+    ureg = UnitRegistry()
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m/s", ureg=ureg)]
+
+    x = TestModel(value="3 m / (2 s)")
+    assert x.value == ureg("1.5 m/s")
+    assert get_unit_cache(ureg).info().currsize == 0
+
+
+def test_quantity_unit_cache_bounded():
+    ureg = UnitRegistry()
+    cache = UnitCache(ureg, maxsize=2)
+
+    assert cache.get("m") == ureg.Unit("m")
+    assert cache.get("s") == ureg.Unit("s")
+    assert cache.get("m") == ureg.Unit("m")
+    assert cache.get("kg") == ureg.Unit("kg")
+    assert cache.info().currsize == 2
+
+    # least recently used unit was evicted
+    cache.get("s")
+    assert cache.info().misses == 4
+    assert cache.info().hits == 1
+
+
+def test_quantity_unit_cache_cleared_on_set_registry():
+    ureg = get_registry()
+    cache = get_unit_cache(ureg)
+    cache.get("m")
+    assert cache.info().currsize > 0
+
+    try:
+        set_registry(UnitRegistry())
+        assert cache.info().currsize == 0
+        assert cache.info().hits == 0
+        assert cache.info().misses == 0
+        assert cache.info().unknown_currsize == 0
+    finally:
+        set_registry(ureg)
+
+
+def test_quantity_unit_cache_unknown_units():
+    ureg = UnitRegistry()
+    cache = get_unit_cache(ureg)
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m", ureg=ureg)]
+
+    for _ in range(3):
+        with pytest.raises(ValidationError, match="meterz"):
+            TestModel(value="1 meterz")
+
+    assert cache.info().misses == 1
+    assert cache.info().unknown_hits == 2
+    assert cache.info().unknown_currsize == 1
+
+    # newly defined units are accepted once the cache is cleared
+    ureg.define("meterz = meter")
+    with pytest.raises(ValidationError):
+        TestModel(value="1 meterz")
+    cache.clear()
+    assert TestModel(value="1 meterz").value == ureg("1 m")
+
+
+def test_quantity_unit_cache_unknown_units_expire():
+    ureg = UnitRegistry()
+    cache = UnitCache(ureg, unknown_ttl=0)
+
+    with pytest.raises(UndefinedUnitError):
+        cache.get("meterz")
+    with pytest.raises(UndefinedUnitError):
+        cache.get("meterz")
+    assert cache.info().misses == 2
+    assert cache.info().unknown_hits == 0
+
+
+def test_quantity_unit_cache_unknown_units_bounded():
+    ureg = UnitRegistry()
+    cache = UnitCache(ureg, unknown_maxsize=2)
+
+    for units in ("meterz", "secondz", "gramz"):
+        with pytest.raises(UndefinedUnitError):
+            cache.get(units)
+    assert cache.info().unknown_currsize == 2
+
+    # oldest unknown unit was evicted
+    with pytest.raises(UndefinedUnitError):
+        cache.get("meterz")
+    assert cache.info().unknown_hits == 0
+
+
+def test_quantity_unit_cache_additive_expression_fallback():
+    ureg = UnitRegistry()
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m", ureg=ureg)]
+
+    assert TestModel(value="1 m + 2 cm").value == ureg("1.02 m")
+    assert TestModel(value={"magnitude": 1, "units": "m + cm"}).value == ureg("1.01 m")
+
+    with pytest.raises(ValueError, match="invalid units"):
+        PydanticPintQuantity("m", ureg=ureg).validate_many(
+            {"units": "m + cm", "magnitudes": [1]}
+        )
+
+
+def test_quantity_unit_cache_digit_separators():
+    ureg = UnitRegistry()
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m", ureg=ureg)]
+
+    # the digits after the separator are not mistaken for unknown units
+    assert TestModel(value="1_000 m").value == ureg("1000 m")
+    assert TestModel(value="1.5_0 m").value == ureg("1.5 m")
+    assert TestModel(value="1.5e1_0 m").value == ureg("1.5e10 m")
+    assert get_unit_cache(ureg).info().unknown_currsize == 0
+
+    with pytest.raises(ValidationError, match="meterz"):
+        TestModel(value="1_000 meterz")
+
+
+def test_quantity_unit_cache_registry_collected():
+    ureg = UnitRegistry()
+    annotation = PydanticPintQuantity("m", ureg=ureg)
+    annotation.validate("1 km")
+    with pytest.raises(ValueError):
+        annotation.validate("1 meterz")
+
+    cache = get_unit_cache(ureg)
+    assert cache.info().currsize == 1
+    assert cache.info().unknown_currsize == 1
+    clear_unit_caches()
+    assert cache.info().currsize == 0
+
+    # the cached units do not keep the unit registry alive
+    annotation.validate("1 km")
+    ref = weakref.ref(ureg)
+    del ureg, annotation, cache
+    gc.collect()
+    assert ref() is None
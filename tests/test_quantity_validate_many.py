@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import List
+
+import pytest
+from pint import UnitRegistry
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel, ValidationError
+
+from pydantic_pint import PydanticPintQuantity, get_registry
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+def test_quantity_validate_many():
+    ureg = get_registry()
+    annotation = PydanticPintQuantity("m/s")
+
+    values = annotation.validate_many(
+        ["1 m/s", "3.6 km/hr", {"magnitude": 2, "units": "km/hr"}, ureg("7.2 km/hr")]
+    )
+    assert [v.u for v in values] == [ureg.Unit("m/s")] * 4
+    assert [v.m for v in values] == pytest.approx([1, 1, 2 / 3.6, 2])
+
+
+def test_quantity_validate_many_dimensions():
+    ureg = get_registry()
+    annotation = PydanticPintQuantity("[length]")
+
+    values = annotation.validate_many(["1 m", "2 km"])
+    assert values == [ureg("1 m"), ureg("2 km")]
+    assert values[1].u == ureg.Unit("km")
+
+
+def test_quantity_validate_many_failure():
+    annotation = PydanticPintQuantity("m")
+
+    with pytest.raises(ValidationError) as exc_info:
+        annotation.validate_many(["1 m", "1 s", "1 km"])
+    assert exc_info.value.errors()[0]["loc"] == (1,)
+    assert exc_info.value.errors()[0]["input"] == "1 s"
+
+    with pytest.raises(ValidationError) as exc_info:
+        annotation.validate_many(["1 m", "1 km", "1"])
+    assert exc_info.value.errors()[0]["loc"] == (2,)
+
+
+def test_quantity_validate_many_other_registry():
+    ureg = get_registry()
+    other = UnitRegistry()
+    annotation = PydanticPintQuantity("m")
+
+    values = annotation.validate_many(
+        [
+            ureg.Quantity(1, "km"),
+            other.Quantity(2, "km"),
+            ureg.Quantity(3, "km"),
+            other.Quantity(4, "m"),
+        ]
+    )
+    assert [v.m for v in values] == pytest.approx([1000, 2000, 3000, 4])
+    assert [v._REGISTRY for v in values] == [ureg, other, ureg, other]
+
+    with pytest.raises(ValidationError) as exc_info:
+        annotation.validate_many([ureg.Quantity(1, "km"), other.Quantity(2, "s")])
+    assert exc_info.value.errors()[0]["loc"] == (1,)
+
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError) as exc_info:
+        annotation.validate_many([ureg.Quantity(1, "m"), other.Quantity(2, "m")], as_array=True)
+    assert exc_info.value.type == "quantity_array"
+
+
+def test_quantity_validate_many_as_array():
+    np = pytest.importorskip("numpy")
+    ureg = get_registry()
+    annotation = PydanticPintQuantity("m")
+
+    value = annotation.validate_many(["1 m", "2 km", "3 mm"], as_array=True)
+    assert isinstance(value.m, np.ndarray)
+    assert value.u == ureg.Unit("m")
+    assert value.m.tolist() == [1, 2000, 0.003]
+
+
+def test_quantity_validate_many_list_annotation():
+    ureg = get_registry()
+
+    class TestModel(BaseModel):
+        values: Annotated[List[PlainQuantity], PydanticPintQuantity("m", ser_mode="dict")]
+
+    x = TestModel(values=["1 m", "2 km", {"magnitude": 3, "units": "mm"}])
+    assert x.values == [ureg("1 m"), ureg("2000 m"), ureg("0.003 m")]
+    assert x.model_dump(mode="json") == {
+        "values": [
+            {"magnitude": 1, "units": "meter"},
+            {"magnitude": 2000.0, "units": "meter"},
+            {"magnitude": 0.003, "units": "meter"},
+        ]
+    }
+
+    x = TestModel.model_validate_json(x.model_dump_json())
+    assert x.values == [ureg("1 m"), ureg("2000 m"), ureg("0.003 m")]
+
+    with pytest.raises(ValidationError):
+        TestModel(values=["1 m", "1 s"])
+
+    schema = TestModel.model_json_schema(mode="validation")
+    assert schema["properties"]["values"]["type"] == "array"
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pint
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel
+
+from pydantic_pint import PydanticPintQuantity
+from pydantic_pint.registry import create_registry
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+def test_registry_create_cache_folder(tmp_path):
+    cache_folder = tmp_path / "cache"
+
+    ureg = create_registry(cache_folder=cache_folder)
+    assert ureg("1 km").to("m").m == 1000
+
+    version_folder = cache_folder / f"pint-{pint.__version__}"
+    assert version_folder.is_dir()
+    cached = sorted(version_folder.iterdir())
+    assert cached
+
+    ureg = create_registry(cache_folder=cache_folder)
+    assert ureg("1 km").to("m").m == 1000
+    assert sorted(version_folder.iterdir()) == cached
+
+
+def test_registry_create_cache_folder_auto(monkeypatch):
+    calls = []
+    unit_registry = pint.UnitRegistry
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        return unit_registry(**{k: v for k, v in kwargs.items() if k != "cache_folder"})
+
+    # the user cache folder is resolved by Pint, not written here
+    monkeypatch.setattr(pint, "UnitRegistry", create)
+    ureg = create_registry(cache_folder=":auto:")
+    assert ureg("1 km").to("m").m == 1000
+    assert calls == [{"cache_folder": ":auto:"}]
+
+
+def test_registry_create_custom_definitions(tmp_path):
+    definitions = tmp_path / "custom.txt"
+    definitions.write_text("smoot = 1.7018 * meter\n")
+
+    ureg = create_registry(
+        definitions,
+        ["furlong_per_fortnight = furlong / fortnight"],
+        cache_folder=tmp_path / "cache",
+    )
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m", ureg=ureg)]
+
+    x = TestModel(value="2 smoot")
+    assert x.value.m == 2 * 1.7018
+    assert ureg("1 furlong_per_fortnight").check("[speed]")
+
+    ureg = create_registry(definitions, cache_folder=tmp_path / "cache")
+    assert ureg("1 smoot").to("m").m == 1.7018
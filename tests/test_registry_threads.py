@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+from pint import UndefinedUnitError, UnitRegistry
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel, ValidationError
+
+from pydantic_pint import PydanticPintQuantity, get_registry, set_registry
+from pydantic_pint.cache import UnitCache
+from pydantic_pint.registry import registry_generation
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+THREADS = 8
+DURATION = 0.5
+
+
+@pytest.fixture(scope="module")
+def other_registry():
+    return UnitRegistry()
+
+
+@pytest.fixture
+def switch_often():
+    # switch threads often to interleave validation with swapping the registry
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        yield
+    finally:
+        sys.setswitchinterval(interval)
+
+
+def _run_threads(target, swap):
+    errors: list[Exception] = []
+    stop = threading.Event()
+
+    def run():
+        try:
+            while not stop.is_set():
+                target()
+        except Exception as e:  # noqa: BLE001
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    try:
+        swap()
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
+
+
+def test_registry_set_while_validating(other_registry, switch_often):
+    ureg = get_registry()
+
+    class TestModel(BaseModel):
+        value: Annotated[PlainQuantity, PydanticPintQuantity("m")]
+
+    registries = (ureg, other_registry)
+
+    def validate():
+        x = TestModel(value="1.5 km")
+        assert x.value.magnitude == 1500
+        assert x.value._REGISTRY is ureg
+
+        with pytest.raises(ValidationError):
+            TestModel(value="1 meterz")
+
+        # new annotations bind the global registry of the moment, consistently
+        annotation = PydanticPintQuantity("km", strict=False)
+        assert annotation.ureg in registries
+        assert annotation._intern_key[2]() is annotation.ureg
+        assert annotation.units == annotation.ureg.Unit("km")
+
+        v = annotation.validate(f"{threading.get_ident() % 1000} m")
+        assert v._REGISTRY is annotation.ureg
+        assert v.units == annotation.units
+
+    def swap():
+        deadline = time.monotonic() + DURATION
+        i = 0
+        while time.monotonic() < deadline:
+            i += 1
+            set_registry(registries[i % 2])
+
+    try:
+        _run_threads(validate, swap)
+    finally:
+        set_registry(ureg)
+
+
+def test_registry_default_loaded_once():
+    # the default registry is loaded lazily; first use from many threads at once
+    code = """
+import threading
+from pydantic_pint import PydanticPintQuantity
+
+errors = []
+
+def create():
+    try:
+        assert PydanticPintQuantity("km").validate("1 m").magnitude == 0.001
+    except BaseException as e:
+        errors.append(e)
+
+threads = [threading.Thread(target=create) for _ in range(8)]
+for thread in threads:
+    thread.start()
+for thread in threads:
+    thread.join()
+assert not errors, errors
+"""
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_registry_generation(switch_often):
+    ureg = get_registry()
+    generation = registry_generation()
+
+    threads = [
+        threading.Thread(target=lambda: [set_registry(ureg) for _ in range(50)])
+        for _ in range(THREADS)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert registry_generation() == generation + THREADS * 50
+    assert get_registry() is ureg
+
+
+def test_unit_cache_cleared_while_parsing():
+    ureg = UnitRegistry()
+    cache = UnitCache(ureg)
+
+    unit = ureg.Unit
+
+    def define_and_clear(units):
+        # another thread defines the units and clears the cache while parsing
+        cache.clear()
+        return unit(units)
+
+    ureg.Unit = define_and_clear
+    with pytest.raises(UndefinedUnitError):
+        cache.get("meterz")
+    assert cache.get("m") == unit("m")
+    assert cache.info().currsize == 0
+    assert cache.info().unknown_currsize == 0
+
+    ureg.Unit = unit
+    assert cache.get("m") == unit("m")
+    assert cache.info().currsize == 1
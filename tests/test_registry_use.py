@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+from pint import UnitRegistry
+from pint.facets.plain import PlainQuantity
+from pydantic import BaseModel, ValidationError
+
+from pydantic_pint import PydanticPintQuantity, get_registry
+from pydantic_pint.parallel import validate_quantities_async
+from pydantic_pint.registry import registry_name, use_registry
+
+try:
+    from typing import Annotated
+except ImportError:
+    from typing_extensions import Annotated
+
+
+@pytest.fixture(scope="module")
+def tenants():
+    tenant_a = UnitRegistry()
+    tenant_a.define("widget = 2 m")
+    tenant_b = UnitRegistry()
+    tenant_b.define("widget = 3 m")
+    return tenant_a, tenant_b
+
+
+class TenantModel(BaseModel):
+    value: Annotated[PlainQuantity, PydanticPintQuantity("m")]
+    values: Annotated[List[PlainQuantity], PydanticPintQuantity("m")] = []
+
+
+def test_use_registry(tenants):
+    tenant_a, tenant_b = tenants
+
+    with use_registry(tenant_a) as ureg:
+        assert ureg is tenant_a
+        assert get_registry() is tenant_a
+        x = TenantModel(value="1 widget", values=["1 widget", "1 m"])
+        assert x.value == tenant_a("2 m")
+        assert x.value._REGISTRY is tenant_a
+        assert [v._REGISTRY for v in x.values] == [tenant_a, tenant_a]
+        assert x.model_dump(mode="json") == {
+            "value": "2 meter",
+            "values": ["2 meter", "1 meter"],
+        }
+
+    with use_registry(tenant_b):
+        x = TenantModel(value="1 widget")
+        assert x.value == tenant_b("3 m")
+
+        # overrides are nested
+        with use_registry(tenant_a):
+            assert TenantModel(value="1 widget").value == tenant_a("2 m")
+        assert get_registry() is tenant_b
+
+    # quantities of the registry are serialized outside of the context
+    assert x.model_dump(mode="json") == {"value": "3 meter", "values": []}
+    assert x.model_dump_json() == '{"value":"3 meter","values":[]}'
+
+    # outside of the context, the global registry is used
+    assert registry_name(get_registry()) == "app"
+    x = TenantModel(value="1 m")
+    assert x.value._REGISTRY is get_registry()
+    with pytest.raises(ValidationError):
+        TenantModel(value="1 widget")
+
+
+def test_use_registry_model_defined_in_context(tenants):
+    tenant_a, tenant_b = tenants
+
+    with use_registry(tenant_a):
+
+        class InnerModel(BaseModel):
+            value: Annotated[PlainQuantity, PydanticPintQuantity("m")]
+
+        assert InnerModel(value="1 widget").value == tenant_a("2 m")
+
+    # the annotation is not bound to the registry of the context it was defined in
+    assert InnerModel.model_fields["value"].metadata[0].ureg is get_registry()
+    x = InnerModel(value="1 m")
+    assert x.value._REGISTRY is get_registry()
+    with pytest.raises(ValidationError):
+        InnerModel(value="1 widget")
+
+    with use_registry(tenant_b):
+        assert InnerModel(value="1 widget").value == tenant_b("3 m")
+
+
+def test_use_registry_annotation_per_registry(tenants):
+    tenant_a, _ = tenants
+    annotation = PydanticPintQuantity("m")
+    assert annotation._for_active_registry() is annotation
+
+    with use_registry(tenant_a):
+        resolved = annotation._for_active_registry()
+        assert resolved is not annotation
+        assert resolved.ureg is tenant_a
+        assert resolved is annotation._for_active_registry()
+        assert resolved is PydanticPintQuantity("m", ureg=tenant_a)
+
+    # annotations with a unit registry are not overridden
+    ureg = get_registry()
+    fixed = PydanticPintQuantity("m", ureg=ureg)
+    assert fixed is not annotation
+    with use_registry(tenant_a):
+        assert fixed._for_active_registry() is fixed
+        assert fixed.validate("1 m")._REGISTRY is ureg
+
+
+def test_use_registry_collected():
+    tenant = UnitRegistry()
+    tenant.define("widget = 2 m")
+
+    with use_registry(tenant):
+        x = TenantModel(value="1 widget", values=["1 widget"])
+        assert x.model_dump(mode="json")["value"] == "2 meter"
+    assert x.value == tenant("2 m")
+
+    # the annotations cloned for the registry do not keep it alive
+    ref = weakref.ref(tenant)
+    del tenant, x
+    gc.collect()
+    assert ref() is None
+
+
+def test_use_registry_tasks(tenants):
+    async def validate(ureg: UnitRegistry) -> list[PlainQuantity]:
+        with use_registry(ureg):
+            results = []
+            for _ in range(10):
+                results.append(TenantModel(value="1 widget").value)
+                await asyncio.sleep(0)
+            return results
+
+    async def main():
+        return await asyncio.gather(*(validate(ureg) for ureg in tenants))
+
+    results_a, results_b = asyncio.run(main())
+    assert all(v == tenants[0]("2 m") for v in results_a)
+    assert all(v == tenants[1]("3 m") for v in results_b)
+
+
+def test_use_registry_threads(tenants):
+    errors: list[Exception] = []
+
+    def validate(ureg: UnitRegistry, magnitude: int):
+        try:
+            with use_registry(ureg):
+                for _ in range(100):
+                    value = TenantModel(value="1 widget").value
+                    assert value._REGISTRY is ureg
+                    assert value.magnitude == magnitude
+        except Exception as e:  # noqa: BLE001
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=validate, args=(ureg, magnitude))
+        for _ in range(4)
+        for ureg, magnitude in zip(tenants, (2, 3))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors, errors
+
+
+def test_use_registry_validate_async(tenants):
+    tenant_a, _ = tenants
+    annotation = PydanticPintQuantity("m")
+
+    async def main():
+        with use_registry(tenant_a), ThreadPoolExecutor(2) as executor:
+            return await validate_quantities_async(
+                annotation, ["1 widget"] * 4, executor=executor, chunk_size=2
+            )
+
+    results = asyncio.run(main())
+    assert all(v._REGISTRY is tenant_a and v == tenant_a("2 m") for v in results)
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import threading
+
+from pydantic_pint import get_registry, registry
+from pydantic_pint.cache import get_unit_cache
+from pydantic_pint.registry import (
+    is_registry_ready,
+    registry_load_time,
+    wait_registry_ready,
+    warm_registry,
+)
+
+
+def test_registry_warm():
+    assert warm_registry(["kPa", "m/s"]) is None
+    assert is_registry_ready()
+    assert wait_registry_ready(timeout=0)
+    assert registry_load_time() is not None
+    assert registry_load_time() >= 0
+
+    cache = get_unit_cache(get_registry())
+    hits = cache.info().hits
+    assert cache.get("kPa") == get_registry().Unit("kPa")
+    assert cache.info().hits == hits + 1
+
+
+def test_registry_warm_background(monkeypatch):
+    # reset the readiness, the registry may be warmed by other tests already
+    monkeypatch.setattr(registry, "_REGISTRY_READY", threading.Event())
+    monkeypatch.setattr(registry, "_REGISTRY_LOAD_TIME", None)
+    assert not is_registry_ready()
+
+    # the registry is not ready until the background thread is done
+    with registry._REGISTRY_WARM_LOCK:
+        thread = warm_registry(["kPa"], background=True)
+        assert thread is not None
+        assert not wait_registry_ready(timeout=0.1)
+        assert registry_load_time() is None
+
+    assert wait_registry_ready(timeout=30)
+    thread.join()
+    assert is_registry_ready()
+    assert registry_load_time() is not None
@@ -37,3 +37,12 @@ def test_quantity_schema_generation_serialization():
 
     schema = TestModel.model_json_schema(mode="serialization")
     assert isinstance(schema, dict)
+
+
+def test_value_schema_generation_shared_serializer():
+    x = pydantic_pint_value(0, "m")
+    y = pydantic_pint_value(1, "s")
+
+    assert x.__pydantic_serializer__ is y.__pydantic_serializer__
+    assert x.__pydantic_serializer__.to_python(x) == "0 meter"
+    assert y.__pydantic_serializer__.to_python(y) == "1 second"